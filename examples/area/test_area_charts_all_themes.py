@@ -1,17 +1,23 @@
 """Test all area chart themes and styles."""
 
+import multiprocessing
+import os
+
 from wisent_plots.charts import AreaChart
-import numpy as np
 
 # Sample data - 3 series
-np.random.seed(42)
 months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-series1 = [100, 120, 115, 134, 145, 150]
-series2 = [80, 95, 100, 110, 120, 125]
-series3 = [60, 70, 75, 85, 95, 100]
+series = [
+    [100, 120, 115, 134, 145, 150],
+    [80, 95, 100, 110, 120, 125],
+    [60, 70, 75, 85, 95, 100],
+]
 
 labels = ["One", "Two", "Three"]
 
+# Set WISENT_COMPRESS=1 to write gzip-compressed .svgz files instead of .svg
+SVG_EXT = '.svgz' if os.environ.get('WISENT_COMPRESS') == '1' else '.svg'
+
 # Create all theme and style variations
 # Style 1: Gradient with lighter edges
 # Style 2: Gradient
@@ -32,35 +38,60 @@ themes = [
     ("white", "White/Light Theme"),
 ]
 
-for theme_folder, theme_name in themes:
-    print(f"\n{'='*60}")
-    print(f"{theme_name}")
-    print('='*60)
 
-    for style_num, style_name, style_desc in styles:
-        print(f"\nCreating {style_desc} area chart...")
+def _render_theme(task):
+    """Render and save every style for a single theme.
+
+    One chart instance is reused across styles via set_style. Returns a
+    list of (filename, error) tuples so one failure doesn't abort the pool.
+    """
+    theme_folder, styles = task
+    chart = AreaChart(edge=True)
+    results = []
 
-        # Create area chart
-        chart = AreaChart(style=style_num, edge=True)
+    for style_num, style_name, _ in styles:
+        filename = f'examples/area/{theme_folder}/area_chart_{theme_folder}_{style_name}{SVG_EXT}'
 
         try:
+            chart.set_style(style_num)
             svg_string = chart.plot_multiple(
                 x=months,
-                y_series=[series1, series2, series3],
+                y_series=series,
                 labels=labels,
                 title="Area Chart",
                 output_format='svg'
             )
 
             # Save to file
-            filename = f'examples/area/{theme_folder}/area_chart_{theme_folder}_{style_name}.svg'
-            with open(filename, 'w') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write(svg_string)
-            print(f"✓ Created: {filename}")
+            chart.save_svg(svg_string, filename)
+            results.append((filename, None))
         except Exception as e:
-            print(f"✗ Error creating {style_name}: {e}")
+            results.append((filename, str(e)))
+
+    return results
+
+
+def main():
+    # Each theme is independent, so render them in parallel
+    tasks = [(theme_folder, styles) for theme_folder, _ in themes]
+
+    # Create output directories up front so workers never race on them
+    for theme_folder, *_ in themes:
+        os.makedirs(f'examples/area/{theme_folder}', exist_ok=True)
+
+    with multiprocessing.Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+        results = [result for theme_results in pool.map(_render_theme, tasks) for result in theme_results]
+
+    for filename, error in results:
+        if error is None:
+            print(f"✓ Created: {filename}")
+        else:
+            print(f"✗ Error creating {filename}: {error}")
+
+    print("\n" + "="*60)
+    print("Area chart generation complete!")
+    print("="*60)
+
 
-print("\n" + "="*60)
-print("Area chart generation complete!")
-print("="*60)
+if __name__ == "__main__":
+    main()
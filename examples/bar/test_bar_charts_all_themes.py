@@ -1,5 +1,8 @@
 """Test all bar chart themes and styles."""
 
+import multiprocessing
+import os
+
 from wisent_plots.charts import BarChart
 
 # Sample data - 3 series for stacked bar chart
@@ -11,6 +14,9 @@ series = [
 ]
 labels = ["One", "Two", "Three"]
 
+# Set WISENT_COMPRESS=1 to write gzip-compressed .svgz files instead of .svg
+SVG_EXT = '.svgz' if os.environ.get('WISENT_COMPRESS') == '1' else '.svg'
+
 # All 5 style variations
 styles = [
     (1, "style1"),
@@ -26,17 +32,22 @@ themes = [
     ("white", "White Theme"),
 ]
 
-for theme_folder, theme_name in themes:
-    print(f"\n{'='*60}")
-    print(f"{theme_name}")
-    print('='*60)
+
+def _render_theme(task):
+    """Render and save every style for a single theme.
+
+    One chart instance is reused across styles via set_style. Returns a
+    list of (filename, error) tuples so one failure doesn't abort the pool.
+    """
+    theme_folder, styles = task
+    chart = BarChart(theme=theme_folder)
+    results = []
 
     for style_num, style_name in styles:
-        print(f"\nCreating bar chart style {style_num}...")
+        filename = f'examples/bar/{theme_folder}/bar_chart_{theme_folder}_{style_name}{SVG_EXT}'
 
         try:
-            # Create bar chart
-            chart = BarChart(style=style_num)
+            chart.set_style(style_num)
             svg_string = chart.plot(
                 categories=categories,
                 series=series,
@@ -46,14 +57,35 @@ for theme_folder, theme_name in themes:
             )
 
             # Save to file
-            filename = f'examples/bar/{theme_folder}/bar_chart_{theme_folder}_{style_name}.svg'
-            with open(filename, 'w') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write(svg_string)
-            print(f"✓ Created: {filename}")
+            chart.save_svg(svg_string, filename)
+            results.append((filename, None))
         except Exception as e:
-            print(f"✗ Error creating {style_name}: {e}")
+            results.append((filename, str(e)))
+
+    return results
+
+
+def main():
+    # Each theme is independent, so render them in parallel
+    tasks = [(theme_folder, styles) for theme_folder, _ in themes]
+
+    # Create output directories up front so workers never race on them
+    for theme_folder, *_ in themes:
+        os.makedirs(f'examples/bar/{theme_folder}', exist_ok=True)
+
+    with multiprocessing.Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+        results = [result for theme_results in pool.map(_render_theme, tasks) for result in theme_results]
+
+    for filename, error in results:
+        if error is None:
+            print(f"✓ Created: {filename}")
+        else:
+            print(f"✗ Error creating {filename}: {error}")
+
+    print("\n" + "="*60)
+    print("Bar chart generation complete!")
+    print("="*60)
+
 
-print("\n" + "="*60)
-print("Bar chart generation complete!")
-print("="*60)
+if __name__ == "__main__":
+    main()
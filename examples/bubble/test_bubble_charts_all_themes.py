@@ -1,8 +1,13 @@
 """Test all bubble chart themes and styles."""
 
+import os
+
 from wisent_plots.charts import BubbleChart
 import numpy as np
 
+# Set WISENT_COMPRESS=1 to write gzip-compressed .svgz files instead of .svg
+SVG_EXT = '.svgz' if os.environ.get('WISENT_COMPRESS') == '1' else '.svg'
+
 # Sample data for regular bubble chart
 np.random.seed(42)
 x_data = [10, 20, 30, 40, 50, 60, 70, 80]
@@ -28,6 +33,10 @@ chart_types = [
     ("radar", "Radar Bubble Chart"),
 ]
 
+# Create output directories up front
+for _, theme_folder, _ in themes:
+    os.makedirs(f'examples/bubble/{theme_folder}', exist_ok=True)
+
 for style_num, theme_folder, theme_name in themes:
     print(f"\n{'='*60}")
     print(f"{theme_name}")
@@ -49,7 +58,7 @@ for style_num, theme_folder, theme_name in themes:
                     category_labels=category_labels,
                     title="Bubble chart"
                 )
-                filename = f'examples/bubble/{theme_folder}/bubble_chart_{theme_folder}.svg'
+                filename = f'examples/bubble/{theme_folder}/bubble_chart_{theme_folder}{SVG_EXT}'
             else:  # radar
                 svg_string = chart.plot(
                     angles=angles,
@@ -59,7 +68,7 @@ for style_num, theme_folder, theme_name in themes:
                     category_labels=category_labels,
                     title="Bubble chart"
                 )
-                filename = f'examples/bubble/{theme_folder}/radar_bubble_chart_{theme_folder}.svg'
+                filename = f'examples/bubble/{theme_folder}/radar_bubble_chart_{theme_folder}{SVG_EXT}'
 
             # Save to file
             chart.save_svg(svg_string, filename)
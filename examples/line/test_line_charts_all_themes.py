@@ -1,17 +1,23 @@
 """Test all line chart themes and styles."""
 
+import multiprocessing
+import os
+
 from wisent_plots.charts import LineChart
-import numpy as np
 
 # Sample data - 3 series
-np.random.seed(42)
 months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-series1 = [100, 120, 115, 134, 145, 150]
-series2 = [80, 95, 100, 110, 120, 125]
-series3 = [60, 70, 75, 85, 95, 100]
+series = [
+    [100, 120, 115, 134, 145, 150],
+    [80, 95, 100, 110, 120, 125],
+    [60, 70, 75, 85, 95, 100],
+]
 
 labels = ["One", "Two", "Three"]
 
+# Set WISENT_COMPRESS=1 to write gzip-compressed .svgz files instead of .svg
+SVG_EXT = '.svgz' if os.environ.get('WISENT_COMPRESS') == '1' else '.svg'
+
 # Line chart styles
 # Style 1: Solid color palette (dark theme)
 # Style 2: Solid color with markers (dark theme)
@@ -39,34 +45,60 @@ theme_styles = [
     ("white", "White Theme", styles_white),
 ]
 
-for theme_folder, theme_name, styles in theme_styles:
-    print(f"\n{'='*60}")
-    print(f"{theme_name}")
-    print('='*60)
 
-    for style_num, style_name, style_desc in styles:
-        print(f"\nCreating {style_desc} line chart...")
+def _render_theme(task):
+    """Render and save every style for a single theme.
+
+    One chart instance is reused across styles via set_style. Returns a
+    list of (filename, error) tuples so one failure doesn't abort the pool.
+    """
+    theme_folder, styles = task
+    chart = LineChart()
+    results = []
+
+    for style_num, style_name, _ in styles:
+        filename = f'examples/line/{theme_folder}/line_chart_{theme_folder}_{style_name}{SVG_EXT}'
 
         try:
-            # Create line chart
-            chart = LineChart(style=style_num)
+            chart.set_style(style_num)
             svg_string = chart.plot_multiple(
                 x=months,
-                y_series=[series1, series2, series3],
+                y_series=series,
                 labels=labels,
                 title="Line chart",
                 output_format='svg'
             )
 
             # Save to file
-            filename = f'examples/line/{theme_folder}/line_chart_{theme_folder}_{style_name}.svg'
-            with open(filename, 'w') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write(svg_string)
-            print(f"✓ Created: {filename}")
+            chart.save_svg(svg_string, filename)
+            results.append((filename, None))
         except Exception as e:
-            print(f"✗ Error creating {style_name}: {e}")
+            results.append((filename, str(e)))
+
+    return results
+
+
+def main():
+    # Each theme is independent, so render them in parallel
+    tasks = [(theme_folder, styles) for theme_folder, _, styles in theme_styles]
+
+    # Create output directories up front so workers never race on them
+    for theme_folder, *_ in theme_styles:
+        os.makedirs(f'examples/line/{theme_folder}', exist_ok=True)
+
+    with multiprocessing.Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+        results = [result for theme_results in pool.map(_render_theme, tasks) for result in theme_results]
+
+    for filename, error in results:
+        if error is None:
+            print(f"✓ Created: {filename}")
+        else:
+            print(f"✗ Error creating {filename}: {error}")
+
+    print("\n" + "="*60)
+    print("Line chart generation complete!")
+    print("="*60)
+
 
-print("\n" + "="*60)
-print("Line chart generation complete!")
-print("="*60)
+if __name__ == "__main__":
+    main()
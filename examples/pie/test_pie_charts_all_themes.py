@@ -1,7 +1,12 @@
 """Test all pie chart themes (brand, black, white)."""
 
+import os
+
 from wisent_plots.charts import PieChart
 
+# Set WISENT_COMPRESS=1 to write gzip-compressed .svgz files instead of .svg
+SVG_EXT = '.svgz' if os.environ.get('WISENT_COMPRESS') == '1' else '.svg'
+
 # Sample data - 6 categories
 values = [25, 20, 15, 15, 13, 12]
 labels = ["One", "Two", "Three", "Four", "Five", "Six"]
@@ -13,6 +18,10 @@ themes = [
     (3, "white", "White Theme")
 ]
 
+# Create output directories up front
+for _, style_name, _ in themes:
+    os.makedirs(f'examples/pie/{style_name}', exist_ok=True)
+
 for style_num, style_name, theme_name in themes:
     print(f"\nCreating {theme_name} pie chart...")
 
@@ -27,7 +36,7 @@ for style_num, style_name, theme_name in themes:
     )
 
     # Save to file
-    filename = f'examples/pie/{style_name}/pie_chart_{style_name}.svg'
+    filename = f'examples/pie/{style_name}/pie_chart_{style_name}{SVG_EXT}'
     chart.save_svg(svg_string, filename)
     print(f"✓ Created: {filename}")
 
@@ -1,7 +1,12 @@
 """Test all radar chart themes (brand, black, white)."""
 
+import os
+
 from wisent_plots.charts import RadarChart
 
+# Set WISENT_COMPRESS=1 to write gzip-compressed .svgz files instead of .svg
+SVG_EXT = '.svgz' if os.environ.get('WISENT_COMPRESS') == '1' else '.svg'
+
 # Sample data - 2 series with 8 axes each (octagon)
 # Values are 0-100 representing distance from center
 series1 = [85, 70, 90, 65, 80, 75, 70, 85]  # "One"
@@ -20,6 +25,10 @@ themes = [
     (3, "white", "White Theme")
 ]
 
+# Create output directories up front
+for _, style_name, _ in themes:
+    os.makedirs(f'examples/radar/{style_name}', exist_ok=True)
+
 for style_num, style_name, theme_name in themes:
     print(f"\nCreating {theme_name} radar chart...")
 
@@ -33,7 +42,7 @@ for style_num, style_name, theme_name in themes:
     )
 
     # Save to file
-    filename = f'examples/radar/{style_name}/radar_chart_{style_name}.svg'
+    filename = f'examples/radar/{style_name}/radar_chart_{style_name}{SVG_EXT}'
     chart.save_svg(svg_string, filename)
     print(f"✓ Created: {filename}")
 
@@ -0,0 +1,43 @@
+"""Tests for the SVG area chart renderers."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from wisent_plots.charts.area.svg_area_chart import SVGAreaChart
+from wisent_plots.charts.area.svg_area_chart_2patterns import SVGAreaChart2Patterns
+from wisent_plots.charts.area.svg_area_chart_gradient import SVGAreaChartGradient
+from wisent_plots.charts.area.svg_area_chart_pattern import SVGAreaChartPattern
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+RENDERERS = [SVGAreaChart, SVGAreaChartGradient, SVGAreaChartPattern, SVGAreaChart2Patterns]
+LABELS = ['a', 'b', 'c']
+
+
+def _band_paths(svg_string):
+    """Return the band <path> elements, the top-level paths with a fill rule."""
+    root = ET.fromstring(svg_string)
+    return [path for path in root.findall(f'{SVG_NS}path') if path.get('fill-rule') == 'evenodd']
+
+
+@pytest.mark.parametrize('renderer', RENDERERS)
+def test_negative_values_clip_bands_to_chart_area(renderer):
+    """Bands reaching outside the chart area are clipped to it."""
+    svg = renderer().create_chart(list(range(5)), [[5, -3, 4, 6, 2], [2, 8, -1, 3, 4], [1, 2, 3, 4, 5]], LABELS)
+
+    root = ET.fromstring(svg)
+    clip_paths = {clip.get('id'): clip for clip in root.iter(f'{SVG_NS}clipPath')}
+    bands = _band_paths(svg)
+    assert len(bands) == 3
+    for band in bands:
+        clip_id = band.get('clip-path')[len('url(#'):-1]
+        assert clip_paths[clip_id].find(f'{SVG_NS}rect') is not None
+
+
+@pytest.mark.parametrize('renderer', RENDERERS)
+def test_non_negative_values_need_no_clip(renderer):
+    svg = renderer().create_chart(list(range(5)), [[5, 3, 4, 6, 2], [2, 8, 0, 3, 4], [1, 2, 3, 4, 5]], LABELS)
+
+    assert 'clipPath' not in svg
+    assert all(band.get('clip-path') is None for band in _band_paths(svg))
@@ -0,0 +1,46 @@
+"""Tests for streamed bubble chart output."""
+
+import gzip
+import io
+
+from wisent_plots.charts import BubbleChart
+from wisent_plots.charts.bubble.svg_bubble_chart import SVGBubbleChart
+from wisent_plots.charts.svg_io import XML_DECLARATION
+
+CHART_ARGS = dict(
+    x_data=[10, 20, 30, 40],
+    y_data=[100, 250, 175, 300],
+    sizes=[5, 20, 10, 15],
+    categories=[0, 1, 1, 2],
+    category_labels=['a<b', 'b', 'c&d'],
+    title='Bubbles & "more"',
+)
+
+
+def test_create_chart_stream_matches_create_chart():
+    chart = SVGBubbleChart()
+    out = io.StringIO()
+    chart.create_chart_stream(out, **CHART_ARGS)
+
+    assert out.getvalue() == chart.create_chart(**CHART_ARGS)
+
+
+def test_save_chart_svgz(tmp_path):
+    chart = SVGBubbleChart()
+    path = tmp_path / 'bubble.svgz'
+    chart.save_chart(str(path), **CHART_ARGS)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        assert f.read() == XML_DECLARATION + chart.create_chart(**CHART_ARGS)
+
+
+def test_bubble_chart_save_chart_matches_plot(tmp_path):
+    for chart_type, data in [
+        ('bubble', CHART_ARGS),
+        ('radar', dict(CHART_ARGS, x_data=None, y_data=None, angles=[0, 90, 180, 270], distances=[20, 40, 60, 80])),
+    ]:
+        chart = BubbleChart(style=2, chart_type=chart_type)
+        path = tmp_path / f'{chart_type}.svg'
+        chart.save_chart(str(path), **data)
+
+        assert path.read_text(encoding='utf-8') == XML_DECLARATION + chart.plot(**data)
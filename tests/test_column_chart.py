@@ -0,0 +1,51 @@
+"""Tests for the SVG column chart."""
+
+import xml.etree.ElementTree as ET
+
+from wisent_plots.charts import ColumnChart
+from wisent_plots.charts.column.svg_column_chart import SVGColumnChart
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+def _column_rects(svg_string):
+    """Return the column <rect> elements, which sit in per-series fill groups."""
+    root = ET.fromstring(svg_string)
+    return [
+        rect
+        for group in root.iter(f'{SVG_NS}g') if 'fill' in group.attrib and 'font-size' not in group.attrib
+        for rect in group.iter(f'{SVG_NS}rect')
+    ]
+
+
+def test_ragged_series_render():
+    """Series of different lengths render; points past the categories are ignored."""
+    svg = ColumnChart(style=1).plot(['Q1', 'Q2'], [[1, 2, 9], [3, 4], [5, 6]], labels=['a', 'b', 'c'])
+
+    assert len(_column_rects(svg)) == 6
+    # The scale still covers the value past the last category (9 * 1.1)
+    assert '>9</text>' in svg
+
+
+def test_create_many_matches_create_chart_for_ragged_series():
+    chart = SVGColumnChart(style=1)
+    categories = ['Q1', 'Q2']
+    batch = [
+        [[1, 2, 9], [3, 4], [5, 6]],
+        [[7, 1], [2, 8, 3], [4, 4]],
+    ]
+    labels = ['a', 'b', 'c']
+
+    expected = [chart.create_chart(categories, series, labels) for series in batch]
+    assert chart.create_many(categories, batch, labels) == expected
+
+
+def test_all_zero_series_render_valid_numbers():
+    chart = SVGColumnChart(style=1)
+    svg = chart.create_chart(['Q1', 'Q2'], [[0, 0], [0, 0]], ['a', 'b'])
+
+    assert 'nan' not in svg
+    for rect in _column_rects(svg):
+        assert float(rect.get('height')) == 0
+
+    assert all('nan' not in s for s in chart.create_many(['Q1', 'Q2'], [[[0, 0], [0, 0]]], ['a', 'b']))
@@ -0,0 +1,118 @@
+"""Tests for the rendered SVG cache."""
+
+import os
+
+import pytest
+
+from wisent_plots.charts import PieChart
+from wisent_plots.charts import svg_cache
+from wisent_plots.charts.svg_cache import CACHE_DIR_ENV, cache_svg, clear_svg_cache
+
+
+class _CountingChart:
+    """Chart stand-in that counts how often it actually renders.
+
+    The count is private so it stays out of the cache key.
+    """
+
+    def __init__(self, style=1):
+        self.style_number = style
+        self._calls = 0
+
+    def set_style(self, style):
+        self.style_number = style
+
+    @cache_svg
+    def plot(self, values, output_format='svg'):
+        self._calls += 1
+        if output_format != 'svg':
+            return ('fig', 'ax')
+        return f'<svg data-style="{self.style_number}">{values}</svg>'
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache(monkeypatch):
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    clear_svg_cache()
+    yield
+    clear_svg_cache()
+
+
+def _render_count(chart, *plot_args):
+    """Return how many times rendering chart.plot(*plot_args) ran."""
+    before = chart._calls
+    chart.plot(*plot_args)
+    return chart._calls - before
+
+
+def test_identical_inputs_hit():
+    first = _CountingChart()
+    second = _CountingChart()
+
+    assert first.plot([1, 2, 3]) == second.plot([1, 2, 3])
+    assert first._calls == 1
+    assert second._calls == 0
+
+
+def test_set_style_misses():
+    chart = _CountingChart()
+    chart.plot([1, 2, 3])
+    chart.set_style(2)
+
+    assert _render_count(chart, [1, 2, 3]) == 1
+
+
+def test_in_place_mutation_misses():
+    chart = _CountingChart()
+    values = [1, 2, 3]
+    chart.plot(values)
+    values[0] = 9
+
+    assert 'data-style="1">[9, 2, 3]' in chart.plot(values)
+    assert chart._calls == 2
+
+
+def test_non_str_results_are_not_stored():
+    class FallbackChart(_CountingChart):
+        """Falls back to a (fig, ax) tuple even when SVG is requested."""
+
+        @cache_svg
+        def plot(self, values, output_format='svg'):
+            self._calls += 1
+            return ('fig', 'ax')
+
+    for chart, output_format in [(_CountingChart(), 'matplotlib'), (FallbackChart(), 'svg')]:
+        assert chart.plot([1, 2, 3], output_format) == ('fig', 'ax')
+        assert _render_count(chart, [1, 2, 3], output_format) == 1
+    assert not svg_cache._memory_cache
+
+
+def test_clear_svg_cache():
+    chart = _CountingChart()
+    chart.plot([1, 2, 3])
+    clear_svg_cache()
+
+    assert _render_count(chart, [1, 2, 3]) == 1
+
+
+def test_real_chart_set_style_misses():
+    chart = PieChart(style=1)
+    brand = chart.plot([1, 2, 3], ['a', 'b', 'c'])
+    chart.set_style(3)
+
+    assert chart.plot([1, 2, 3], ['a', 'b', 'c']) != brand
+
+
+def test_disk_cache_leaves_only_complete_files(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    svg_string = _CountingChart().plot([1, 2, 3])
+
+    (entry,) = os.listdir(tmp_path)
+    assert entry.endswith('.svg')
+    assert (tmp_path / entry).read_text(encoding='utf-8') == svg_string
+
+    # A fresh process (empty memory cache) reads it back from disk
+    clear_svg_cache()
+    chart = _CountingChart()
+    assert chart.plot([1, 2, 3]) == svg_string
+    assert chart._calls == 0
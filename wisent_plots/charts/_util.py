@@ -0,0 +1,38 @@
+"""Helpers shared by the chart classes."""
+
+from typing import Dict, Optional, Union
+
+
+def resolve_style(
+    style: Union[int, str],
+    style_map: Dict[str, int],
+    max_num: Optional[int] = None
+) -> int:
+    """Convert a style name or number to a style number.
+
+    Args:
+        style: Style number, or a name from style_map (case-insensitive)
+        style_map: Mapping of style names to style numbers
+        max_num: Highest valid style number. If given, numbers outside
+            1..max_num are rejected.
+
+    Returns:
+        Style number
+
+    Raises:
+        ValueError: If the style name is unknown or the number is out of range
+    """
+    # Convert style name to number if needed
+    if isinstance(style, str):
+        style_lower = style.lower()
+        if style_lower in style_map:
+            style_number = style_map[style_lower]
+        else:
+            raise ValueError(f"Unknown style name: {style}. Valid names are: {', '.join(style_map.keys())}")
+    else:
+        style_number = style
+
+    if max_num is not None and (style_number < 1 or style_number > max_num):
+        raise ValueError(f"Style must be between 1 and {max_num}, got {style_number}")
+
+    return style_number
@@ -1,19 +1,96 @@
 """Area chart implementation with Wisent brand styling."""
 
-from typing import Optional, Union, List, Tuple
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+import functools
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List, Tuple
 import numpy as np
 
 from wisent_plots.styles.style_config import get_style
+from wisent_plots.charts._util import resolve_style
+from wisent_plots.charts.svg_cache import cache_svg
+from wisent_plots.charts.svg_io import write_svg
+from wisent_plots.charts.area.area_chart_renderer import _minmax_downsample
 from wisent_plots.charts.area.svg_area_chart import SVGAreaChart
 from wisent_plots.charts.area.svg_area_chart_gradient import SVGAreaChartGradient
 from wisent_plots.charts.area.svg_area_chart_pattern import SVGAreaChartPattern
 from wisent_plots.charts.area.svg_area_chart_2patterns import SVGAreaChart2Patterns
 
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
+
+# Edge colors are the fill color darkened by 30%, i.e. each channel is
+# scaled by _EDGE_DARKEN_NUM / _EDGE_DARKEN_DEN
+_EDGE_DARKEN_NUM = 7
+_EDGE_DARKEN_DEN = 10
+
+
+@functools.lru_cache(maxsize=256)
+def _darken_hex(fill_color: str) -> str:
+    """Return a '#rrggbb' color darkened by 30%.
+
+    Decodes all three channels with a single int() parse and darkens them
+    with integer arithmetic. Palettes are small and reused across plots, so
+    results are cached.
+    """
+    v = int(fill_color[1:7], 16)
+    r = ((v >> 16) & 0xFF) * _EDGE_DARKEN_NUM // _EDGE_DARKEN_DEN
+    g = ((v >> 8) & 0xFF) * _EDGE_DARKEN_NUM // _EDGE_DARKEN_DEN
+    b = (v & 0xFF) * _EDGE_DARKEN_NUM // _EDGE_DARKEN_DEN
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+
+@functools.lru_cache(maxsize=64)
+def _darken_hex_batch(fill_colors: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Darken a whole palette of '#rrggbb' colors at once.
+
+    The channels of every color are unpacked and scaled in a single numpy
+    pass, and whole palettes are cached, so plot_multiple pays for one
+    cache lookup per call rather than one per series.
+    """
+    packed = np.array([int(c[1:7], 16) for c in fill_colors], dtype=np.uint32)
+    channels = np.stack([(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF])
+    r, g, b = channels * _EDGE_DARKEN_NUM // _EDGE_DARKEN_DEN
+    return tuple(f"#{v:06x}" for v in ((r << 16) | (g << 8) | b).tolist())
+
+
+def _as_float_array(a) -> np.ndarray:
+    """Return a as a C-contiguous float64 array, without copying if it already is one."""
+    if isinstance(a, np.ndarray) and a.dtype == np.float64 and a.flags['C_CONTIGUOUS']:
+        return a
+    return np.ascontiguousarray(a, dtype=np.float64)
+
+
+def _format_with_leading_zero(x, pos):
+    """Format tick labels with leading zeros."""
+    return f"{int(x):02d}" if x >= 0 else str(int(x))
+
+
+@functools.lru_cache(maxsize=None)
+def _leading_zero_formatter():
+    """Return the shared leading-zero tick formatter.
+
+    Built on first use so that importing this module doesn't import
+    matplotlib, then reused by every chart.
+    """
+    from matplotlib.ticker import FuncFormatter
+
+    return FuncFormatter(_format_with_leading_zero)
+
+
+@functools.lru_cache(maxsize=None)
+def _rectangle_class():
+    """Return matplotlib's Rectangle patch class for legend handles.
+
+    Resolved once on first use, like _leading_zero_formatter, so neither
+    importing this module nor each legend pays for the import statement.
+    """
+    from matplotlib.patches import Rectangle
+
+    return Rectangle
+
+
 class AreaChart:
     """Create area charts with Wisent brand styling.
 
@@ -29,13 +106,22 @@ class AreaChart:
         >>> plt.show()
     """
 
+    # SVG renderer for each style that has one when edge=True
+    _SVG_DISPATCH = {
+        1: SVGAreaChart,
+        2: SVGAreaChartGradient,
+        3: SVGAreaChartPattern,
+        4: SVGAreaChart2Patterns,
+    }
+
     def __init__(
         self,
         style: Union[int, str] = 1,
         edge: bool = False,
         stacked: bool = True,
         figsize: Tuple[float, float] = (10, 6),
-        dpi: int = 100
+        dpi: int = 100,
+        max_points: Optional[int] = None
     ):
         """Initialize an AreaChart with specified styling.
 
@@ -46,10 +132,74 @@ class AreaChart:
             stacked: Whether to stack areas on top of each other (True) or overlap (False).
             figsize: Figure size as (width, height) in inches.
             dpi: Dots per inch for the figure resolution.
+            max_points: Maximum number of points drawn per series on the matplotlib
+                        path; longer series are reduced to a per-bucket min/max
+                        envelope. Defaults to two points per horizontal pixel.
+
+        Raises:
+            ValueError: If style is not between 1 and 5 or not a recognized style name.
+        """
+        self.style_number, self.style_config = self._resolve_style_config(style)
+        self._flatten_style()
+        self.edge = edge
+        self.stacked = stacked
+        self.figsize = figsize
+        self.dpi = dpi
+        self.max_points = max_points if max_points else int(figsize[0] * dpi * 2)
+
+    def set_style(self, style: Union[int, str]) -> None:
+        """Switch the chart to a different style without rebuilding it.
+
+        Args:
+            style: Style number (1-5) or style name ("solid", "gradient", etc.).
 
         Raises:
             ValueError: If style is not between 1 and 5 or not a recognized style name.
         """
+        self.style_number, self.style_config = self._resolve_style_config(style)
+        self._flatten_style()
+
+    def _flatten_style(self) -> None:
+        """Copy the nested style_config values used while plotting onto attributes.
+
+        Saves walking several dict levels for every value on each plot call.
+        """
+        sc = self.style_config
+        colors = sc["colors"]
+        font = sc["font"]
+
+        self._bg_color = colors["background"]
+        self._text_color = colors["text"]
+        self._legend_color = colors.get("legend_text", colors["text"])
+        self._grid_color = colors["grid"]
+        self._palette = [colors["primary"], colors["secondary"], colors["accent"]]
+
+        self._fill_alpha = sc["fill"]["alpha"]
+        self._line_width = sc["line"]["width"]
+        self._line_style = sc["line"]["style"]
+        self._line_alpha = sc["line"]["alpha"]
+        self._edge_width = sc["edge"]["width"]
+        self._edge_config = sc["edge"]["color"]
+
+        self._grid_alpha = sc["grid"]["alpha"]
+        self._grid_linestyle = sc["grid"]["linestyle"]
+        self._grid_linewidth = sc["grid"]["linewidth"]
+
+        self._font_family = font["family"]
+        self._title_fs = font["size"]["title"]
+        self._title_fw = font["weight"]["title"]
+        self._label_fs = font["size"]["label"]
+        self._label_fw = font["weight"]["label"]
+        self._tick_fs = font["size"]["tick"]
+        self._title_pad = sc["spacing"]["title_pad"]
+        self._label_pad = sc["spacing"]["label_pad"]
+
+        # The SVG renderer depends on the style, so drop any cached one
+        self._svg_chart = None
+
+    @classmethod
+    def _resolve_style_config(cls, style: Union[int, str]) -> Tuple[int, Dict[str, Any]]:
+        """Resolve a style number or name to (style_number, style_config)."""
         # Map style names to numbers
         style_map = {
             "solid": 1,
@@ -61,21 +211,9 @@ class AreaChart:
             "dark": 7,
         }
 
-        # Convert style name to number if needed
-        if isinstance(style, str):
-            style_lower = style.lower()
-            if style_lower in style_map:
-                self.style_number = style_map[style_lower]
-            else:
-                raise ValueError(f"Unknown style name: {style}. Valid names are: {', '.join(style_map.keys())}")
-        else:
-            self.style_number = style
+        style_number = resolve_style(style, style_map)
 
-        self.style_config = get_style(self.style_number)
-        self.edge = edge
-        self.stacked = stacked
-        self.figsize = figsize
-        self.dpi = dpi
+        return style_number, get_style(style_number)
 
     def plot(
         self,
@@ -86,9 +224,9 @@ class AreaChart:
         ylabel: Optional[str] = None,
         color: Optional[str] = None,
         label: Optional[str] = None,
-        fig: Optional[Figure] = None,
-        ax: Optional[Axes] = None,
-    ) -> Tuple[Figure, Axes]:
+        fig: Optional["Figure"] = None,
+        ax: Optional["Axes"] = None,
+    ) -> Tuple["Figure", "Axes"]:
         """Create an area chart.
 
         Args:
@@ -99,36 +237,42 @@ class AreaChart:
             ylabel: Y-axis label.
             color: Custom color (hex or named color). If None, uses style's primary color.
             label: Legend label for the data series.
-            fig: Existing figure to plot on. If None, creates new figure.
+            fig: Existing figure to plot on. If None, creates new figure
+                 (and applies tight_layout to it).
             ax: Existing axes to plot on. If None, creates new axes.
 
         Returns:
             Tuple of (figure, axes) objects.
         """
-        # Convert to numpy arrays
+        # Convert to numpy arrays (x may hold category labels, so only y is
+        # coerced to float)
         x = np.asarray(x)
-        y = np.asarray(y)
+        y = _as_float_array(y)
+        x, (y,) = _minmax_downsample(x, [y], self.max_points)
 
         # Create figure and axes if not provided
-        if fig is None or ax is None:
+        created_fig = fig is None or ax is None
+        if created_fig:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
 
         # Apply style configuration
         self._apply_style(fig, ax)
 
         # Determine colors
-        fill_color = color if color else self.style_config["colors"]["primary"]
+        fill_color = color if color else self._palette[0]
         edge_color = self._get_edge_color(fill_color)
 
         # Plot area
-        edge_width = self.style_config["edge"]["width"] if self.edge else 0
+        edge_width = self._edge_width if self.edge else 0
         edge_line_color = edge_color if self.edge else None
 
         # Fill area
         ax.fill_between(
             x,
             y,
-            alpha=self.style_config["fill"]["alpha"],
+            alpha=self._fill_alpha,
             color=fill_color,
             label=label,
             edgecolor=edge_line_color,
@@ -140,56 +284,59 @@ class AreaChart:
             x,
             y,
             color=fill_color,
-            linewidth=self.style_config["line"]["width"],
-            linestyle=self.style_config["line"]["style"],
-            alpha=self.style_config["line"]["alpha"],
+            linewidth=self._line_width,
+            linestyle=self._line_style,
+            alpha=self._line_alpha,
         )
 
         # Set labels and title
         if title:
             ax.set_title(
                 title,
-                fontsize=self.style_config["font"]["size"]["title"],
-                fontweight=self.style_config["font"]["weight"]["title"],
-                pad=self.style_config["spacing"]["title_pad"],
-                color=self.style_config["colors"]["text"],
+                fontsize=self._title_fs,
+                fontweight=self._title_fw,
+                pad=self._title_pad,
+                color=self._text_color,
                 loc='left',  # Left-align title like in Figma
             )
 
         if xlabel:
             ax.set_xlabel(
                 xlabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
-                labelpad=self.style_config["spacing"]["label_pad"],
-                color=self.style_config["colors"]["text"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
+                labelpad=self._label_pad,
+                color=self._text_color,
             )
 
         if ylabel:
             ax.set_ylabel(
                 ylabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
-                labelpad=self.style_config["spacing"]["label_pad"],
-                color=self.style_config["colors"]["text"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
+                labelpad=self._label_pad,
+                color=self._text_color,
             )
 
         # Add legend if label provided
         if label:
             legend = ax.legend(
-                fontsize=self.style_config["font"]["size"]["tick"],
+                fontsize=self._tick_fs,
                 frameon=False,
             )
             # Set legend text color
-            legend_color = self.style_config["colors"].get("legend_text", self.style_config["colors"]["text"])
+            legend_color = self._legend_color
             for text in legend.get_texts():
                 text.set_color(legend_color)
 
-        # Tight layout
-        fig.tight_layout()
+        # Tight layout, only for figures we created; callers passing their own
+        # fig/ax manage the layout themselves
+        if created_fig:
+            fig.tight_layout()
 
         return fig, ax
 
+    @cache_svg(when=lambda self: self._renders_svg())
     def plot_multiple(
         self,
         x: Union[List, np.ndarray],
@@ -199,10 +346,10 @@ class AreaChart:
         title: Optional[str] = None,
         xlabel: Optional[str] = None,
         ylabel: Optional[str] = None,
-        fig: Optional[Figure] = None,
-        ax: Optional[Axes] = None,
+        fig: Optional["Figure"] = None,
+        ax: Optional["Axes"] = None,
         output_format: str = 'svg',
-    ) -> Union[Tuple[Figure, Axes], str]:
+    ) -> Union[Tuple["Figure", "Axes"], str]:
         """Create an area chart with multiple data series.
 
         Args:
@@ -213,7 +360,8 @@ class AreaChart:
             title: Chart title.
             xlabel: X-axis label.
             ylabel: Y-axis label.
-            fig: Existing figure to plot on. If None, creates new figure.
+            fig: Existing figure to plot on. If None, creates new figure
+                 (and applies tight_layout to it).
             ax: Existing axes to plot on. If None, creates new axes.
             output_format: Output format - 'svg' for SVG string (style 1 + edge only),
                           'matplotlib' for figure/axes tuple.
@@ -221,44 +369,18 @@ class AreaChart:
         Returns:
             Tuple of (figure, axes) objects or SVG string depending on output_format and style.
         """
-        # Use SVG implementation for style=1 with edge=True
-        if self.style_number == 1 and self.edge and output_format == 'svg':
-            svg_chart = SVGAreaChart()
-            svg_string = svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart")
-            return svg_string
-        # Use SVG gradient implementation for style=2 with edge=True
-        if self.style_number == 2 and self.edge and output_format == 'svg':
-            svg_chart = SVGAreaChartGradient()
-            svg_string = svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart")
-            return svg_string
-        # Use SVG pattern implementation for style=3 with edge=True
-        if self.style_number == 3 and self.edge and output_format == 'svg':
-            svg_chart = SVGAreaChartPattern()
-            svg_string = svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart")
-            return svg_string
-        # Use SVG 2 patterns implementation for style=4 with edge=True
-        if self.style_number == 4 and self.edge and output_format == 'svg':
-            svg_chart = SVGAreaChart2Patterns()
-            svg_string = svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart")
-            return svg_string
-        # Use SVG solid colors implementation for style=5 with edge=True
-        if self.style_number == 5 and output_format == 'svg':
-            svg_chart = SVGAreaChart()
-            # Update colors to use solid colors from style 5
-            svg_chart.colors = {
-                'background': self.style_config['colors']['background'],
-                'title': self.style_config['colors']['text'],
-                'legend_text': self.style_config['colors']['legend_text'],
-                'grid': self.style_config['colors']['grid'],
-                'area': self.style_config['colors']['primary'],  # Fallback for compatibility
-                'primary': self.style_config['colors']['primary'],
-                'secondary': self.style_config['colors']['secondary'],
-                'accent': self.style_config['colors']['accent'],
-            }
-            svg_string = svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart", self.style_config)
-            return svg_string
+        if output_format == 'svg' and self._renders_svg():
+            svg_chart = self._get_svg_chart()
+            # Use SVG solid colors implementation for style=5
+            if self.style_number == 5:
+                return svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart", self.style_config)
+            return svg_chart.create_chart(x, y_series, labels or [], title or "Area Chart")
+
         # Create figure and axes if not provided
-        if fig is None or ax is None:
+        created_fig = fig is None or ax is None
+        if created_fig:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
 
         # Apply style configuration
@@ -267,26 +389,21 @@ class AreaChart:
         # Convert x to numpy array
         x = np.asarray(x)
 
-        # Determine colors
+        # Determine colors, cycling the palette so every series gets one
         if colors is None:
-            colors = [
-                self.style_config["colors"]["primary"],
-                self.style_config["colors"]["secondary"],
-                self.style_config["colors"]["accent"],
-            ]
-            # Extend colors if needed
-            while len(colors) < len(y_series):
-                colors.extend(colors)
+            colors = self._palette
+        colors = [colors[i % len(colors)] for i in range(len(y_series))]
 
         # Convert all y_series to numpy arrays
-        y_arrays = [np.asarray(y) for y in y_series]
+        y_arrays = [_as_float_array(y) for y in y_series]
+        x, y_arrays = _minmax_downsample(x, y_arrays, self.max_points)
 
         # If stacked, plot using stackplot for proper stacking
         if self.stacked:
             # Reverse the order for bottom-to-top stacking (darkest at bottom)
-            y_arrays_reversed = list(reversed(y_arrays))
-            colors_reversed = list(reversed(colors[:len(y_arrays)]))
-            labels_reversed = list(reversed(labels)) if labels else None
+            y_arrays_reversed = y_arrays[::-1]
+            colors_reversed = colors[::-1]
+            labels_reversed = labels[::-1] if labels else None
 
             # Create stacked areas
             ax.stackplot(
@@ -294,108 +411,144 @@ class AreaChart:
                 *y_arrays_reversed,
                 colors=colors_reversed,
                 labels=labels_reversed,
-                alpha=self.style_config["fill"]["alpha"],
+                alpha=self._fill_alpha,
                 edgecolor='none',
             )
 
             # Add edges if requested
             if self.edge:
-                # Draw edge lines between stacked areas
-                cumulative = np.zeros_like(x, dtype=float)
-                for i, y in enumerate(y_arrays_reversed):
-                    cumulative += y
-                    edge_color = self._get_edge_color(colors_reversed[i])
-                    ax.plot(
-                        x,
-                        cumulative,
-                        color=edge_color,
-                        linewidth=self.style_config["edge"]["width"],
-                        alpha=1.0,
-                        zorder=10,
-                    )
-        else:
-            # Overlapping mode (original behavior)
-            for i, y in enumerate(y_arrays):
-                fill_color = colors[i % len(colors)]
-                edge_color = self._get_edge_color(fill_color)
-                label = labels[i] if labels and i < len(labels) else None
-
-                edge_width = self.style_config["edge"]["width"] if self.edge else 0
-                edge_line_color = edge_color if self.edge else None
-
-                # Fill area
-                ax.fill_between(
-                    x,
-                    y,
-                    alpha=self.style_config["fill"]["alpha"],
-                    color=fill_color,
-                    label=label,
-                    edgecolor=edge_line_color,
-                    linewidth=edge_width,
+                from matplotlib.collections import LineCollection
+
+                # Draw edge lines between stacked areas as one collection,
+                # using the x values as converted by stackplot (e.g. categories)
+                x_values = np.asarray(ax.convert_xunits(x), dtype=float)
+                cumulative = np.cumsum(np.stack(y_arrays_reversed, axis=0), axis=0)
+                segments = [np.column_stack([x_values, top]) for top in cumulative]
+                edges = LineCollection(
+                    segments,
+                    colors=self._get_edge_colors(colors_reversed),
+                    linewidths=self._edge_width,
+                    alpha=1.0,
+                    zorder=10,
                 )
+                ax.add_collection(edges)
+        else:
+            from matplotlib.collections import LineCollection, PolyCollection
+
+            # Overlapping mode: every series' fill goes into one
+            # PolyCollection and every line into one LineCollection
+            ax.xaxis.update_units(x)
+            x_values = np.asarray(ax.convert_xunits(x), dtype=float)
+            baseline = np.column_stack([x_values[::-1], np.zeros_like(x_values)])
+            lines = [np.column_stack([x_values, y]) for y in y_arrays]
+
+            fills = PolyCollection(
+                [np.concatenate([line, baseline]) for line in lines],
+                facecolors=colors,
+                edgecolors=self._get_edge_colors(colors) if self.edge else 'none',
+                linewidths=self._edge_width if self.edge else 0,
+                alpha=self._fill_alpha,
+            )
+            ax.add_collection(fills)
 
-                # Plot line
-                ax.plot(
-                    x,
-                    y,
-                    color=fill_color,
-                    linewidth=self.style_config["line"]["width"],
-                    linestyle=self.style_config["line"]["style"],
-                    alpha=self.style_config["line"]["alpha"],
-                )
+            ax.add_collection(LineCollection(
+                lines,
+                colors=colors,
+                linewidths=self._line_width,
+                linestyles=self._line_style,
+                alpha=self._line_alpha,
+            ))
+            ax.autoscale_view()
 
         # Set labels and title
         if title:
             ax.set_title(
                 title,
-                fontsize=self.style_config["font"]["size"]["title"],
-                fontweight=self.style_config["font"]["weight"]["title"],
-                pad=self.style_config["spacing"]["title_pad"],
-                color=self.style_config["colors"]["text"],
+                fontsize=self._title_fs,
+                fontweight=self._title_fw,
+                pad=self._title_pad,
+                color=self._text_color,
                 loc='left',  # Left-align title like in Figma
             )
 
         if xlabel:
             ax.set_xlabel(
                 xlabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
-                labelpad=self.style_config["spacing"]["label_pad"],
-                color=self.style_config["colors"]["text"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
+                labelpad=self._label_pad,
+                color=self._text_color,
             )
 
         if ylabel:
             ax.set_ylabel(
                 ylabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
-                labelpad=self.style_config["spacing"]["label_pad"],
-                color=self.style_config["colors"]["text"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
+                labelpad=self._label_pad,
+                color=self._text_color,
             )
 
         # Add horizontal legend with color boxes if labels provided
         if labels:
             self._add_horizontal_legend(fig, ax, labels, colors[:len(labels)])
 
-        # Tight layout
-        fig.tight_layout()
+        # Tight layout, only for figures we created; callers passing their own
+        # fig/ax manage the layout themselves
+        if created_fig:
+            fig.tight_layout()
 
         return fig, ax
 
-    def _apply_style(self, fig: Figure, ax: Axes) -> None:
+    def _renders_svg(self) -> bool:
+        """Return whether plot_multiple has an SVG renderer for this chart.
+
+        Styles 1-4 have dedicated SVG renderers when edge=True; style 5
+        always renders SVG with solid colors. Anything else falls back to
+        matplotlib even when SVG output is requested.
+        """
+        return (self.edge and self.style_number in self._SVG_DISPATCH) or self.style_number == 5
+
+    def _get_svg_chart(self):
+        """Return the SVG renderer for the current style.
+
+        The renderer is created on first use and reused by later calls until
+        set_style changes the style. Style 5 uses the generic SVGAreaChart
+        with its solid colors applied.
+        """
+        if self._svg_chart is None:
+            if self.style_number == 5:
+                svg_chart = SVGAreaChart()
+                # Update colors to use solid colors from style 5
+                svg_chart.colors = {
+                    'background': self._bg_color,
+                    'title': self._text_color,
+                    'legend_text': self._legend_color,
+                    'grid': self._grid_color,
+                    'area': self._palette[0],  # Fallback for compatibility
+                    'primary': self._palette[0],
+                    'secondary': self._palette[1],
+                    'accent': self._palette[2],
+                }
+            else:
+                svg_chart = self._SVG_DISPATCH[self.style_number]()
+            self._svg_chart = svg_chart
+        return self._svg_chart
+
+    def _apply_style(self, fig: "Figure", ax: "Axes") -> None:
         """Apply style configuration to figure and axes."""
         # Set background colors
-        fig.patch.set_facecolor(self.style_config["colors"]["background"])
-        ax.set_facecolor(self.style_config["colors"]["background"])
+        fig.patch.set_facecolor(self._bg_color)
+        ax.set_facecolor(self._bg_color)
 
         # Configure grid - only vertical lines for Figma style
         ax.grid(
             True,
             axis='x',  # Only vertical grid lines
-            alpha=self.style_config["grid"]["alpha"],
-            linestyle=self.style_config["grid"]["linestyle"],
-            linewidth=self.style_config["grid"]["linewidth"],
-            color=self.style_config["colors"]["grid"],
+            alpha=self._grid_alpha,
+            linestyle=self._grid_linestyle,
+            linewidth=self._grid_linewidth,
+            color=self._grid_color,
             zorder=0,
         )
         ax.grid(False, axis='y')  # No horizontal grid lines
@@ -412,8 +565,8 @@ class AreaChart:
         # Configure X-axis tick parameters
         ax.tick_params(
             axis="x",
-            labelsize=self.style_config["font"]["size"]["tick"],
-            colors=self.style_config["colors"]["legend_text"],
+            labelsize=self._tick_fs,
+            colors=self._legend_color,
             length=0,  # No tick marks
             pad=10,
         )
@@ -421,8 +574,12 @@ class AreaChart:
         # Format x-axis labels with leading zeros
         self._format_xaxis_labels(ax)
 
-        # Set font family
-        plt.rcParams["font.family"] = self.style_config["font"]["family"]
+        # Set font family, skipping the global rcParams write (and its
+        # validation) when the family is already active
+        import matplotlib.pyplot as plt
+
+        if plt.rcParams["font.family"] != [self._font_family]:
+            plt.rcParams["font.family"] = self._font_family
 
     def _get_edge_color(self, fill_color: str) -> str:
         """Get edge color based on fill color.
@@ -430,21 +587,11 @@ class AreaChart:
         If style specifies 'auto', returns a darker version of the fill color.
         Otherwise returns the specified edge color.
         """
-        edge_config = self.style_config["edge"]["color"]
+        edge_config = self._edge_config
 
         if edge_config == "auto" or edge_config == "darker":
-            # Convert hex to RGB, darken, and convert back
             if fill_color.startswith("#"):
-                # Remove '#' and convert to RGB
-                rgb = tuple(int(fill_color[i:i+2], 16) / 255.0 for i in (1, 3, 5))
-                # Darken by 30%
-                darkened = tuple(max(0, c * 0.7) for c in rgb)
-                # Convert back to hex
-                return "#{:02x}{:02x}{:02x}".format(
-                    int(darkened[0] * 255),
-                    int(darkened[1] * 255),
-                    int(darkened[2] * 255)
-                )
+                return _darken_hex(fill_color)
             else:
                 return fill_color
         elif edge_config:
@@ -452,12 +599,18 @@ class AreaChart:
         else:
             return fill_color
 
-    def _add_horizontal_legend(self, fig: Figure, ax: Axes, labels: List[str], colors: List[str]) -> None:
+    def _get_edge_colors(self, fill_colors: List[str]) -> List[str]:
+        """Get edge colors for a list of fill colors, see _get_edge_color."""
+        if self._edge_config in ("auto", "darker") and all(c.startswith("#") for c in fill_colors):
+            return list(_darken_hex_batch(tuple(fill_colors)))
+        return [self._get_edge_color(c) for c in fill_colors]
+
+    def _add_horizontal_legend(self, fig: "Figure", ax: "Axes", labels: List[str], colors: List[str]) -> None:
         """Add horizontal legend with color boxes at the top."""
-        from matplotlib.patches import Rectangle
+        Rectangle = _rectangle_class()
 
-        legend_color = self.style_config["colors"].get("legend_text", self.style_config["colors"]["text"])
-        font_size = self.style_config["font"]["size"]["tick"]
+        legend_color = self._legend_color
+        font_size = self._tick_fs
 
         # Create legend elements manually
         legend_elements = []
@@ -484,19 +637,13 @@ class AreaChart:
         for text in legend.get_texts():
             text.set_color(legend_color)
 
-    def _format_xaxis_labels(self, ax: Axes) -> None:
+    def _format_xaxis_labels(self, ax: "Axes") -> None:
         """Format x-axis labels with leading zeros (01, 02, etc)."""
-        from matplotlib.ticker import FuncFormatter
-
-        def format_with_leading_zero(x, pos):
-            """Format tick labels with leading zeros."""
-            return f"{int(x):02d}" if x >= 0 else str(int(x))
-
-        ax.xaxis.set_major_formatter(FuncFormatter(format_with_leading_zero))
+        ax.xaxis.set_major_formatter(_leading_zero_formatter())
 
     def save(
         self,
-        fig: Figure,
+        fig: "Figure",
         filename: str,
         dpi: Optional[int] = None,
         transparent: bool = False,
@@ -516,3 +663,12 @@ class AreaChart:
             bbox_inches="tight",
             transparent=transparent,
         )
+
+    def save_svg(self, svg_string: str, filename: str):
+        """Save SVG string to file.
+
+        Args:
+            svg_string: SVG content as string
+            filename: Output filename
+        """
+        write_svg(svg_string, filename)
@@ -1,43 +1,29 @@
 """Components for rendering chart title, legend, and axes."""
 
 import xml.etree.ElementTree as ET
-from typing import List
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from wisent_plots.charts.svg_markup import element
 
-def render_title_and_legend(
-    svg,
+
+def _title_and_legend_elements(
     title: str,
     labels: List[str],
     colors: dict,
     padding_x: int,
     padding_y: int,
-    title_gap: int,
-    chart_top_margin: int
-) -> int:
-    """Render title, legend, and axes. Returns chart_start_y.
-
-    Args:
-        svg: SVG element tree root
-        title: Chart title
-        labels: List of legend labels
-        colors: Color configuration dict
-        padding_x: Horizontal padding
-        padding_y: Vertical padding
-        title_gap: Gap between title and legend
-        chart_top_margin: Margin before chart area
-
-    Returns:
-        Y coordinate where chart area starts
-    """
+    title_gap: int
+) -> Iterator[Tuple[str, Dict[str, str], Optional[str]]]:
+    """Lay out the title and legend, yielding (tag, attrs, text) per element."""
     # Title (20px, left-aligned at padding_x, padding_y)
-    title_elem = ET.SubElement(svg, 'text', {
+    yield 'text', {
         'x': str(padding_x),
         'y': str(padding_y + 20),
         'fill': colors['title'],
         'font-size': '20',
         'font-weight': '400'
-    })
-    title_elem.text = title
+    }, title
 
     # Legend - horizontal layout below title
     legend_y = padding_y + 20 + title_gap + 4
@@ -51,32 +37,118 @@ def render_title_and_legend(
     if 'quinary' in colors:
         color_palette.append(colors['quinary'])
 
-    for i, label in enumerate(labels):
+    # Each item is box (20px) + gap (8px) + estimated text width + gap (20px)
+    item_xs = accumulate(
+        (20 + 8 + len(label) * 8 + 20 for label in labels[:-1]),
+        initial=legend_x
+    )
+
+    # Per-item attribute templates; 'x' and 'fill' are filled in per item and
+    # the key order matches the order attributes are serialized in
+    box_attrs = {
+        'x': '',
+        'y': str(legend_y),
+        'width': '20',
+        'height': '10',
+        'fill': '',
+        'rx': '2',
+        'ry': '2'
+    }
+    text_attrs = {
+        'x': '',
+        'y': str(legend_y + 9),
+        'fill': colors['legend_text'],
+        'font-size': '14',
+        'font-weight': '400'
+    }
+
+    for i, (label, item_x) in enumerate(zip(labels, item_xs)):
         # Color box (20x10px with 2px border radius)
         # Cycle through colors if we have more series than colors
-        color = color_palette[i % len(color_palette)]
-        ET.SubElement(svg, 'rect', {
-            'x': str(legend_x),
-            'y': str(legend_y),
-            'width': '20',
-            'height': '10',
-            'fill': color,
-            'rx': '2',
-            'ry': '2'
-        })
+        yield 'rect', {
+            **box_attrs,
+            'x': str(item_x),
+            'fill': color_palette[i % len(color_palette)]
+        }, None
 
         # Label text (14px, gap of 8px from box)
-        text = ET.SubElement(svg, 'text', {
-            'x': str(legend_x + 28),
-            'y': str(legend_y + 9),
-            'fill': colors['legend_text'],
-            'font-size': '14',
-            'font-weight': '400'
-        })
-        text.text = label
-
-        # Move to next legend item (gap of 20px between items)
-        legend_x += 20 + 8 + len(label) * 8 + 20
+        yield 'text', {**text_attrs, 'x': str(item_x + 28)}, label
+
+
+def render_title_and_legend(
+    svg,
+    title: str,
+    labels: List[str],
+    colors: dict,
+    padding_x: int,
+    padding_y: int,
+    title_gap: int,
+    chart_top_margin: int
+) -> int:
+    """Render title, legend, and axes. Returns chart_start_y.
+
+    Args:
+        svg: SVG element tree root
+        title: Chart title
+        labels: List of legend labels
+        colors: Color configuration dict
+        padding_x: Horizontal padding
+        padding_y: Vertical padding
+        title_gap: Gap between title and legend
+        chart_top_margin: Margin before chart area
+
+    Returns:
+        Y coordinate where chart area starts
+    """
+    # Elements are streamed through a TreeBuilder, which is cheaper than a
+    # SubElement call per element, then attached to svg in one extend().
+    # TreeBuilder needs a single root, so a throwaway <g> wraps them.
+    builder = ET.TreeBuilder()
+    builder.start('g', {})
+    for tag, attrs, text in _title_and_legend_elements(
+        title, labels, colors, padding_x, padding_y, title_gap
+    ):
+        builder.start(tag, attrs)
+        if text is not None:
+            builder.data(text)
+        builder.end(tag)
+    builder.end('g')
+    svg.extend(list(builder.close()))
 
     # Return chart start Y position
     return padding_y + 20 + title_gap + 24 + chart_top_margin
+
+
+def render_title_and_legend_markup(
+    title: str,
+    labels: List[str],
+    colors: dict,
+    padding_x: int,
+    padding_y: int,
+    title_gap: int,
+    chart_top_margin: int
+) -> Tuple[str, int]:
+    """Render title and legend directly as SVG markup.
+
+    String-building counterpart of render_title_and_legend for renderers
+    that assemble their SVG as text rather than as an element tree.
+
+    Args:
+        title: Chart title
+        labels: List of legend labels
+        colors: Color configuration dict
+        padding_x: Horizontal padding
+        padding_y: Vertical padding
+        title_gap: Gap between title and legend
+        chart_top_margin: Margin before chart area
+
+    Returns:
+        Tuple of (markup, chart_start_y)
+    """
+    markup = "".join(
+        element(tag, attrs, text)
+        for tag, attrs, text in _title_and_legend_elements(
+            title, labels, colors, padding_x, padding_y, title_gap
+        )
+    )
+    return markup, padding_y + 20 + title_gap + 24 + chart_top_margin
@@ -1,12 +1,21 @@
 """Main area chart rendering with paths and grid lines."""
 
+import functools
+import hashlib
+from collections import OrderedDict
 import numpy as np
-import xml.etree.ElementTree as ET
 from typing import List, Tuple
 
+from wisent_plots.charts.svg_markup import SVGWriter
+
+# Band paths for the most recent inputs, so rendering the same data in
+# several styles generates them once
+_PATHS_CACHE_SIZE = 8
+_paths_cache: "OrderedDict[tuple, List[Tuple[str, str]]]" = OrderedDict()
+
 
 def render_area_chart(
-    svg,
+    svg: SVGWriter,
     x_data: List[float],
     y_series: List[List[float]],
     chart_x: int,
@@ -19,7 +28,7 @@ def render_area_chart(
     """Render the main area chart with grid lines and x-axis labels.
 
     Args:
-        svg: SVG element tree root
+        svg: SVG writer to append markup to
         x_data: X-axis data points
         y_series: List of Y-axis data series (will be stacked)
         chart_x: X coordinate where chart starts
@@ -29,17 +38,6 @@ def render_area_chart(
         colors: Color configuration dict
         style_config: Optional style configuration dict (for solid colors, etc.)
     """
-    # Create clipping path for chart area
-    clip_id = "chart-clip"
-    defs = ET.SubElement(svg, 'defs')
-    clipPath = ET.SubElement(defs, 'clipPath', {'id': clip_id})
-    ET.SubElement(clipPath, 'rect', {
-        'x': str(chart_x),
-        'y': str(chart_start_y),
-        'width': str(chart_width),
-        'height': str(chart_height - 40)
-    })
-
     # Generate stacked area paths
     paths = _generate_stacked_paths(
         x_data, y_series,
@@ -47,34 +45,49 @@ def render_area_chart(
         chart_width, chart_height - 40
     )
 
-    # Draw grid lines FIRST so area bands appear in front
-    grid_spacing = 67
-    for i in range(15):
-        x = chart_x + (i * grid_spacing)
-        if x <= chart_x + chart_width:
-            # Dashed vertical line
-            ET.SubElement(svg, 'line', {
-                'x1': str(x),
-                'y1': str(chart_start_y),
-                'x2': str(x),
-                'y2': str(chart_start_y + chart_height - 40),
-                'stroke': colors['grid'],
-                'stroke-width': '1',
-                'stroke-dasharray': '4,4'
-            })
-
-            # X-axis label below chart
-            if i < 14:
-                label_text = f"{i+1:02d}"
-                label_elem = ET.SubElement(svg, 'text', {
-                    'x': str(x + 10),
-                    'y': str(chart_start_y + chart_height - 10),
-                    'fill': colors['legend_text'],
-                    'font-size': '14',
-                    'font-weight': '400',
-                    'text-anchor': 'middle'
-                })
-                label_elem.text = label_text
+    # Only negative values can push a band outside the chart area, so
+    # only then do the bands need clipping
+    band_attrs = {}
+    if _bands_need_clip(y_series):
+        clip_id = "chart-clip"
+        svg.start('defs', {})
+        svg.start('clipPath', {'id': clip_id})
+        svg.element('rect', {
+            'x': str(chart_x),
+            'y': str(chart_start_y),
+            'width': str(chart_width),
+            'height': str(chart_height - 40)
+        })
+        svg.end('clipPath')
+        svg.end('defs')
+        band_attrs['clip-path'] = f'url(#{clip_id})'
+
+    # Draw grid lines FIRST so area bands appear in front. Lines and
+    # x-axis labels each take their shared styling from a parent <g>
+    grid_xs = _grid_xs(chart_x, chart_width)
+    line_y1 = str(chart_start_y)
+    line_y2 = str(chart_start_y + chart_height - 40)
+    svg.start('g', {
+        'stroke': colors['grid'],
+        'stroke-width': '1',
+        'stroke-dasharray': '4,4'
+    })
+    for x in grid_xs:
+        # Dashed vertical line
+        svg.element('line', {'x1': str(x), 'y1': line_y1, 'x2': str(x), 'y2': line_y2})
+    svg.end('g')
+
+    # X-axis labels below chart, beside every grid line but the last
+    label_y = str(chart_start_y + chart_height - 10)
+    svg.start('g', {
+        'fill': colors['legend_text'],
+        'font-size': '14',
+        'font-weight': '400',
+        'text-anchor': 'middle'
+    })
+    for i, x in enumerate(grid_xs[:14]):
+        svg.element('text', {'x': str(x + 10), 'y': label_y}, f"{i+1:02d}")
+    svg.end('g')
 
     # Draw area bands AFTER grid lines so they appear in front
     # Check if we're using solid colors (style 5) or opacity-based colors
@@ -83,27 +96,27 @@ def render_area_chart(
     if use_solid_colors:
         # Style 5: Use distinct solid colors for each band
         # Bottom (largest) - primary color (green)
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': paths[0][0],
             'fill': colors['primary'],  # #C5FFC8
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Middle band - secondary color (red)
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': paths[1][0],
             'fill': colors['secondary'],  # #FA5A46
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Top band (smallest) - accent color (purple)
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': paths[2][0],
             'fill': colors['accent'],  # #B19ECC
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
     else:
         # Original opacity-based rendering
@@ -111,32 +124,94 @@ def render_area_chart(
         # Assign opacities to match: bottom=1.0 (lightest), top=0.4 (darkest)
 
         # Top band (smallest) - opacity 0.4 (darkest)
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': paths[2][0],
             'fill': colors['area'],  # #C5FFC8
             'opacity': '0.4',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Middle band - opacity 0.5
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': paths[1][0],
             'fill': colors['area'],  # #C5FFC8
             'opacity': '0.5',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Bottom band (largest) - opacity 1.0 (lightest, fully opaque)
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': paths[0][0],
             'fill': colors['area'],  # #C5FFC8
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
 
+def _bands_need_clip(y_series) -> bool:
+    """Return whether stacked bands can reach outside the chart area.
+
+    Non-negative series stack upwards from the baseline to the stacked
+    maximum, which is exactly the chart area. A negative value pushes an
+    edge below the baseline, or a lower band's top above the maximum.
+    """
+    series = np.asarray(y_series, dtype=np.float64)
+    return bool(series.size) and bool(series.min() < 0)
+
+
+@functools.lru_cache(maxsize=32)
+def _grid_xs(chart_x: int, chart_width: int) -> Tuple[int, ...]:
+    """Return the x positions of the dashed vertical grid lines.
+
+    Lines are 67px apart, at most 15 of them, and none past the right
+    edge of the chart area.
+    """
+    grid_spacing = 67
+    return tuple(
+        chart_x + (i * grid_spacing) for i in range(15)
+        if chart_x + (i * grid_spacing) <= chart_x + chart_width
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _x_positions(chart_x: int, chart_w: int, n: int) -> Tuple[float, ...]:
+    """Return the x coordinate of each of n evenly spaced data points."""
+    dx = chart_w / (n - 1)
+    return tuple((chart_x + np.arange(n) * dx).tolist())
+
+
+def _minmax_downsample(x: np.ndarray, ys: List[np.ndarray], max_points: int):
+    """Decimate x and every series in ys to roughly max_points samples.
+
+    The points are split into max_points // 2 buckets and, for every
+    series, the minimum and maximum of each bucket are kept (plus the
+    endpoints), so peaks and troughs survive while drawing far fewer
+    points than there are pixels. Data that is short enough, or x that is
+    not numeric, is returned unchanged.
+    """
+    n = len(x)
+    if n <= max_points or x.dtype.kind not in 'iuf':
+        return x, ys
+
+    n_buckets = max(1, max_points // 2)
+    bucket = -(-n // n_buckets)
+    stacked = np.stack(ys, axis=0)
+    # Pad the last bucket with the final value so every bucket is full
+    padded = np.pad(stacked, ((0, 0), (0, n_buckets * bucket - n)), mode='edge')
+    buckets = padded.reshape(len(ys), n_buckets, bucket)
+    starts = np.arange(n_buckets) * bucket
+
+    keep = np.concatenate([
+        (buckets.argmin(axis=2) + starts).ravel(),
+        (buckets.argmax(axis=2) + starts).ravel(),
+        [0, n - 1],
+    ])
+    keep = np.unique(np.minimum(keep, n - 1))
+    return x[keep], [y[keep] for y in ys]
+
+
 def _generate_stacked_paths(
     x_data, y_series, chart_x, chart_y, chart_w, chart_h
 ) -> List[Tuple[str, str]]:
@@ -144,6 +219,7 @@ def _generate_stacked_paths(
 
     Creates band paths where each band shows only its own contribution,
     stacked on top of previous bands, creating distinct visible bands.
+    Paths for recently seen data and chart geometry are reused.
 
     Args:
         x_data: X-axis data points
@@ -156,52 +232,106 @@ def _generate_stacked_paths(
     Returns:
         List of (path_string, color) tuples
     """
-    paths = []
-
-    # Chart bottom
-    chart_bottom = chart_y + chart_h
-
-    # Calculate cumulative sum to find the true max (for stacked charts)
-    cumulative_sum = np.zeros(len(x_data))
-    for series in y_series:
-        cumulative_sum += np.array(series)
-
-    # Max value is the max of the cumulative total
-    max_val = np.max(cumulative_sum)
-
-    # Cumulative sum to know where each band starts
-    cumulative = np.zeros(len(x_data))
+    # Key on a digest of the data rather than the data itself, which keeps
+    # the cache small however long the series are
+    series = np.ascontiguousarray(y_series, dtype=np.float64)
+    key = (
+        hashlib.blake2b(series, digest_size=16).digest(), series.shape,
+        len(x_data), chart_x, chart_y, chart_w, chart_h
+    )
+    paths = _paths_cache.get(key)
+    if paths is None:
+        paths = _build_stacked_paths(len(x_data), series, chart_x, chart_y, chart_w, chart_h)
+        _paths_cache[key] = paths
+        if len(_paths_cache) > _PATHS_CACHE_SIZE:
+            _paths_cache.popitem(last=False)
+    else:
+        _paths_cache.move_to_end(key)
+    return list(paths)
 
-    # Generate band paths (not cumulative areas, but bands between baselines)
-    for series_data in y_series:
-        y_array = np.array(series_data)
 
-        # This band's baseline is the previous cumulative
-        baseline = cumulative.copy()
+def _build_stacked_paths(
+    n, series, chart_x, chart_y, chart_w, chart_h
+) -> List[Tuple[str, str]]:
+    """Build the band paths for _generate_stacked_paths.
 
-        # Add current series to cumulative for next band
-        cumulative += y_array
+    Args:
+        n: Number of x-axis data points
+        series: Y-axis data series as a 2D float array, one row per series
+        chart_x: X coordinate of chart area
+        chart_y: Y coordinate of chart area
+        chart_w: Width of chart area
+        chart_h: Height of chart area
 
-        # Create a band path from baseline to baseline+series
-        # Start at left edge, at the baseline
-        baseline_y_start = chart_bottom - (baseline[0] / max_val * chart_h)
-        path_d = f"M {chart_x},{baseline_y_start}"
+    Returns:
+        List of (path_string, color) tuples. The paths are empty if there
+        are fewer than two points or the stacked total never exceeds zero.
+    """
+    # Bands need at least two points to span the chart
+    if n < 2 or series.size == 0:
+        return [("", None)] * len(series)
 
-        # Draw along the baseline (left to right)
-        for i in range(len(x_data)):
-            x_pos = chart_x + i * (chart_w / (len(x_data) - 1))
-            y_pos = chart_bottom - (baseline[i] / max_val * chart_h)
-            path_d += f" L {x_pos},{y_pos}"
+    paths = []
 
-        # Now draw the top edge (right to left) at baseline + series
-        for i in range(len(x_data) - 1, -1, -1):
-            x_pos = chart_x + i * (chart_w / (len(x_data) - 1))
-            y_pos = chart_bottom - ((baseline[i] + y_array[i]) / max_val * chart_h)
-            path_d += f" L {x_pos},{y_pos}"
+    # Chart bottom
+    chart_bottom = chart_y + chart_h
 
-        # Close path
-        path_d += " Z"
+    # Stack every series in one cumulative sum: row k is the top edge of
+    # band k, and row k - 1 (or the chart bottom) is its baseline
+    tops = np.cumsum(series, axis=0)
+
+    # Max value is the max of the cumulative total; with nothing above zero
+    # there is no height to scale to, so every band is empty
+    max_val = tops[-1].max()
+    if not max_val > 0:
+        return [("", None)] * len(series)
+
+    # Scale data to pixels with one multiply instead of a divide per point
+    y_scale = chart_h / max_val
+
+    # With more points than pixel columns, keep only each column's min and
+    # max (on the original indices, so x positions don't move)
+    indices, tops = _minmax_downsample(np.arange(n), list(tops), 2 * chart_w)
+
+    # X positions are shared by every band and, for a given size, by every
+    # chart, so they come from a cache
+    xs = _x_positions(chart_x, chart_w, n)
+    if len(indices) < n:
+        xs = [xs[i] for i in indices.tolist()]
+
+    # Pixel y of every band edge, with the zero baseline as edge 0
+    edges = np.vstack([np.zeros(len(indices)), tops])
+    edges_y = chart_bottom - edges * y_scale
+
+    # An interior point on the same pixel row as both its neighbours adds
+    # nothing to the raster, since the edge runs straight through it; drop
+    # it. Each edge is filtered once, so the top of one band and the
+    # baseline of the next keep the same points and never leave a gap.
+    rows = np.rint(edges_y)
+    keep = np.ones(edges_y.shape, dtype=bool)
+    keep[:, 1:-1] = (rows[:, 1:-1] != rows[:, :-2]) | (rows[:, 1:-1] != rows[:, 2:])
+
+    # Coordinates are rounded to 2 decimals; finer detail is sub-pixel.
+    # Each edge's kept points are copied into one interleaved x,y buffer
+    # and formatted by a single %-operation instead of one f-string each
+    xs = np.asarray(xs)
+    edge_points = []
+    for ys, ks in zip(edges_y, keep):
+        coords = np.empty((int(ks.sum()), 2))
+        coords[:, 0] = xs[ks]
+        coords[:, 1] = ys[ks]
+        edge_points.append(("%.2f,%.2f\n" * len(coords) % tuple(coords.ravel().tolist())).splitlines())
 
-        paths.append((path_d, None))
+    # Generate band paths (not cumulative areas, but bands between baselines)
+    for baseline, top in zip(edge_points, edge_points[1:]):
+        # Create a band path from baseline to baseline+series: start at the
+        # left edge on the baseline, draw along the baseline (left to right),
+        # then back along the top edge (right to left) and close the path
+        parts = [f"M {baseline[0]}"]
+        parts.extend(f"L {point}" for point in baseline)
+        parts.extend(f"L {point}" for point in reversed(top))
+        parts.append("Z")
+
+        paths.append((" ".join(parts), None))
 
     return paths
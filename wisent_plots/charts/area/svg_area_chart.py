@@ -1,10 +1,11 @@
 """SVG-based area chart for pixel-perfect Figma matching."""
 
 from typing import List
-import xml.etree.ElementTree as ET
 
-from .area_chart_components import render_title_and_legend
+from .area_chart_components import render_title_and_legend_markup
 from .area_chart_renderer import render_area_chart
+from ..svg_io import write_svg
+from ..svg_markup import STYLE_MARKUP, SVGWriter
 
 
 class SVGAreaChart:
@@ -63,8 +64,11 @@ class SVGAreaChart:
         Returns:
             SVG string
         """
+        # Markup is written straight to a string buffer; no element tree
+        svg = SVGWriter()
+
         # Create SVG root with exact Figma dimensions
-        svg = ET.Element('svg', {
+        svg.start('svg', {
             'width': str(self.width),
             'height': str(self.height),
             'xmlns': 'http://www.w3.org/2000/svg',
@@ -72,14 +76,10 @@ class SVGAreaChart:
         })
 
         # Add Hubot Sans font definition
-        style = ET.SubElement(svg, 'style')
-        style.text = """
-            @import url('https://fonts.googleapis.com/css2?family=Hubot+Sans:wght@400&display=swap');
-            text { font-family: 'Hubot Sans', sans-serif; }
-        """
+        svg.raw(STYLE_MARKUP)
 
         # Background with rounded corners (20px radius from Figma)
-        bg = ET.SubElement(svg, 'rect', {
+        svg.element('rect', {
             'width': str(self.width),
             'height': str(self.height),
             'fill': self.colors['background'],
@@ -88,10 +88,11 @@ class SVGAreaChart:
         })
 
         # Render title, legend, axes
-        chart_start_y = render_title_and_legend(
-            svg, title, labels, self.colors,
+        title_markup, chart_start_y = render_title_and_legend_markup(
+            title, labels, self.colors,
             self.padding_x, self.padding_y, self.title_gap, self.chart_top_margin
         )
+        svg.raw(title_markup)
         chart_x = self.padding_x
 
         # Render main area chart
@@ -100,8 +101,8 @@ class SVGAreaChart:
             self.chart_width, self.chart_height, self.colors, style_config
         )
 
-        # Convert to string
-        return ET.tostring(svg, encoding='unicode', method='xml')
+        svg.end('svg')
+        return svg.getvalue()
 
     def _darken_color(self, hex_color: str, factor: float = 0.7) -> str:
         """Darken a hex color."""
@@ -111,9 +112,7 @@ class SVGAreaChart:
 
     def save_svg(self, svg_string: str, filename: str):
         """Save SVG to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
 
     def save_png(self, svg_string: str, filename: str, dpi: int = 150):
         """Convert SVG to PNG using cairosvg."""
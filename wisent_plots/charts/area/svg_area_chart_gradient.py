@@ -3,7 +3,8 @@
 import xml.etree.ElementTree as ET
 from typing import List
 from wisent_plots.charts.area.area_chart_components import render_title_and_legend
-from wisent_plots.charts.area.area_chart_renderer import _generate_stacked_paths
+from wisent_plots.charts.area.area_chart_renderer import _bands_need_clip, _generate_stacked_paths, _grid_xs
+from wisent_plots.charts.svg_io import write_svg
 
 
 class SVGAreaChartGradient:
@@ -84,10 +85,13 @@ class SVGAreaChartGradient:
             'ry': '20'
         })
 
-        # Define gradients FIRST (before rendering legend)
-        # Use a temporary chart_start_y for gradient positioning
-        temp_chart_start_y = self.padding_y + 20 + self.title_gap + 24 + self.chart_top_margin
-        self._create_gradients(svg, temp_chart_start_y)
+        # Single <defs> shared by the gradients and, when needed, the clip path
+        defs = ET.SubElement(svg, 'defs')
+
+        # Define gradients FIRST (before rendering legend); the chart start
+        # is fixed by the layout, so it is known before the legend is drawn
+        chart_start_y = self.padding_y + 20 + self.title_gap + 24 + self.chart_top_margin
+        self._create_gradients(defs, chart_start_y)
 
         # Render title and legend with gradients
         chart_start_y = self._render_title_and_legend_with_gradients(
@@ -98,12 +102,9 @@ class SVGAreaChartGradient:
         chart_x = self.padding_x
         chart_height = self.height - self.padding_y - chart_start_y
 
-        # Update gradients with actual chart position
-        self._create_gradients(svg, chart_start_y)
-
         # Render area chart with gradients
         self._render_gradient_areas(
-            svg, x_data, y_series,
+            svg, defs, x_data, y_series,
             chart_x, chart_start_y,
             self.chart_width, chart_height
         )
@@ -165,11 +166,8 @@ class SVGAreaChartGradient:
         # Return chart start Y position
         return self.padding_y + 20 + self.title_gap + 24 + self.chart_top_margin
 
-    def _create_gradients(self, svg, chart_start_y):
+    def _create_gradients(self, defs, chart_start_y):
         """Create SVG gradient definitions."""
-        defs = svg.find('defs')
-        if defs is None:
-            defs = ET.SubElement(svg, 'defs')
 
         # Gradient for bottom band (lightest) - from light to lighter
         grad1 = ET.SubElement(defs, 'linearGradient', {
@@ -225,6 +223,7 @@ class SVGAreaChartGradient:
     def _render_gradient_areas(
         self,
         svg,
+        defs,
         x_data: List[float],
         y_series: List[List[float]],
         chart_x: int,
@@ -233,20 +232,6 @@ class SVGAreaChartGradient:
         chart_height: int
     ):
         """Render gradient-filled area chart."""
-        # Create clipping path
-        clip_id = "chart-clip-gradient"
-        defs = svg.find('defs')
-        if defs is None:
-            defs = ET.SubElement(svg, 'defs')
-
-        clipPath = ET.SubElement(defs, 'clipPath', {'id': clip_id})
-        ET.SubElement(clipPath, 'rect', {
-            'x': str(chart_x),
-            'y': str(chart_start_y),
-            'width': str(chart_width),
-            'height': str(chart_height - 40)
-        })
-
         # Generate stacked paths
         paths = _generate_stacked_paths(
             x_data, y_series,
@@ -254,34 +239,45 @@ class SVGAreaChartGradient:
             chart_width, chart_height - 40
         )
 
-        # Draw grid lines FIRST so area bands appear in front
-        grid_spacing = 67
-        for i in range(15):
-            x = chart_x + (i * grid_spacing)
-            if x <= chart_x + chart_width:
-                # Dashed vertical line
-                ET.SubElement(svg, 'line', {
-                    'x1': str(x),
-                    'y1': str(chart_start_y),
-                    'x2': str(x),
-                    'y2': str(chart_start_y + chart_height - 40),
-                    'stroke': self.colors['grid'],
-                    'stroke-width': '1',
-                    'stroke-dasharray': '4,4'
-                })
-
-                # X-axis label
-                if i < 14:
-                    label_text = f"{i+1:02d}"
-                    label_elem = ET.SubElement(svg, 'text', {
-                        'x': str(x + 10),
-                        'y': str(chart_start_y + chart_height - 10),
-                        'fill': self.colors['legend_text'],
-                        'font-size': '14',
-                        'font-weight': '400',
-                        'text-anchor': 'middle'
-                    })
-                    label_elem.text = label_text
+        # Only negative values can push a band outside the chart area, so
+        # only then do the bands need clipping
+        band_attrs = {}
+        if _bands_need_clip(y_series):
+            clip_id = "chart-clip-gradient"
+            clipPath = ET.SubElement(defs, 'clipPath', {'id': clip_id})
+            ET.SubElement(clipPath, 'rect', {
+                'x': str(chart_x),
+                'y': str(chart_start_y),
+                'width': str(chart_width),
+                'height': str(chart_height - 40)
+            })
+            band_attrs['clip-path'] = f'url(#{clip_id})'
+
+        # Draw grid lines FIRST so area bands appear in front. Lines and
+        # x-axis labels each take their shared styling from a parent <g>
+        grid_xs = _grid_xs(chart_x, chart_width)
+        line_y1 = str(chart_start_y)
+        line_y2 = str(chart_start_y + chart_height - 40)
+        line_group = ET.SubElement(svg, 'g', {
+            'stroke': self.colors['grid'],
+            'stroke-width': '1',
+            'stroke-dasharray': '4,4'
+        })
+        for x in grid_xs:
+            # Dashed vertical line
+            ET.SubElement(line_group, 'line', {'x1': str(x), 'y1': line_y1, 'x2': str(x), 'y2': line_y2})
+
+        # X-axis labels below chart, beside every grid line but the last
+        label_y = str(chart_start_y + chart_height - 10)
+        label_group = ET.SubElement(svg, 'g', {
+            'fill': self.colors['legend_text'],
+            'font-size': '14',
+            'font-weight': '400',
+            'text-anchor': 'middle'
+        })
+        for i, x in enumerate(grid_xs[:14]):
+            label_elem = ET.SubElement(label_group, 'text', {'x': str(x + 10), 'y': label_y})
+            label_elem.text = f"{i+1:02d}"
 
         # Draw bands with gradients
         # Top band (smallest) - darkest gradient
@@ -289,7 +285,7 @@ class SVGAreaChartGradient:
             'd': paths[2][0],
             'fill': 'url(#grad-top)',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Middle band - medium gradient
@@ -297,7 +293,7 @@ class SVGAreaChartGradient:
             'd': paths[1][0],
             'fill': 'url(#grad-middle)',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Bottom band (largest) - lightest gradient
@@ -305,11 +301,9 @@ class SVGAreaChartGradient:
             'd': paths[0][0],
             'fill': 'url(#grad-bottom)',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
     def save_svg(self, svg_string: str, filename: str) -> None:
         """Save SVG string to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
@@ -1,9 +1,16 @@
 """SVG area chart with pattern fills matching Figma design."""
 
 import xml.etree.ElementTree as ET
+from pathlib import Path
 from typing import List
 from wisent_plots.charts.area.area_chart_components import render_title_and_legend
-from wisent_plots.charts.area.area_chart_renderer import _generate_stacked_paths
+from wisent_plots.charts.area.area_chart_renderer import _bands_need_clip, _generate_stacked_paths, _grid_xs
+from wisent_plots.charts.svg_io import write_svg
+
+# Pattern asset files, resolved once at import
+_ASSETS_DIR = Path(__file__).resolve().parents[2] / 'assets'
+_PATTERN_MIDDLE_PATH = _ASSETS_DIR / 'pattern_crossing_lines.svg'
+_PATTERN_TOP_PATH = _ASSETS_DIR / 'large' / 'noise_rectangle_large.svg'
 
 
 class SVGAreaChartPattern:
@@ -84,8 +91,11 @@ class SVGAreaChartPattern:
             'ry': '20'
         })
 
+        # Single <defs> shared by the patterns and, when needed, the clip path
+        defs = ET.SubElement(svg, 'defs')
+
         # Define patterns FIRST (before rendering legend)
-        self._create_patterns(svg)
+        self._create_patterns(defs)
 
         # Render title and legend with patterns
         chart_start_y = self._render_title_and_legend_with_patterns(
@@ -98,7 +108,7 @@ class SVGAreaChartPattern:
 
         # Render area chart with patterns
         self._render_pattern_areas(
-            svg, x_data, y_series,
+            svg, defs, x_data, y_series,
             chart_x, chart_start_y,
             self.chart_width, chart_height
         )
@@ -160,23 +170,13 @@ class SVGAreaChartPattern:
         # Return chart start Y position
         return self.padding_y + 20 + self.title_gap + 24 + self.chart_top_margin
 
-    def _create_patterns(self, svg):
+    def _create_patterns(self, defs):
         """Embed SVG pattern from asset file for top band."""
-        import os
-
-        defs = svg.find('defs')
-        if defs is None:
-            defs = ET.SubElement(svg, 'defs')
-
-        # Get path to assets directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_dir = os.path.join(os.path.dirname(os.path.dirname(current_dir)), 'assets')
-
         # Pattern for bottom band (lightest) - solid light green
         # No pattern needed, will use solid color
 
         # Pattern for middle band - crossing diagonal lines
-        pattern_middle_file = os.path.join(assets_dir, 'pattern_crossing_lines.svg')
+        pattern_middle_file = _PATTERN_MIDDLE_PATH
 
         # Parse the checkered pattern SVG file
         pattern_middle_tree = ET.parse(pattern_middle_file)
@@ -211,7 +211,7 @@ class SVGAreaChartPattern:
             self._copy_element(child, pattern_middle)
 
         # Top band (darkest) - load noise pattern from file
-        pattern_file = os.path.join(assets_dir, 'large', 'noise_rectangle_large.svg')
+        pattern_file = _PATTERN_TOP_PATH
 
         # Parse the pattern SVG file
         pattern_tree = ET.parse(pattern_file)
@@ -272,6 +272,7 @@ class SVGAreaChartPattern:
     def _render_pattern_areas(
         self,
         svg,
+        defs,
         x_data: List[float],
         y_series: List[List[float]],
         chart_x: int,
@@ -280,20 +281,6 @@ class SVGAreaChartPattern:
         chart_height: int
     ):
         """Render pattern-filled area chart."""
-        # Create clipping path
-        clip_id = "chart-clip-pattern"
-        defs = svg.find('defs')
-        if defs is None:
-            defs = ET.SubElement(svg, 'defs')
-
-        clipPath = ET.SubElement(defs, 'clipPath', {'id': clip_id})
-        ET.SubElement(clipPath, 'rect', {
-            'x': str(chart_x),
-            'y': str(chart_start_y),
-            'width': str(chart_width),
-            'height': str(chart_height - 40)
-        })
-
         # Generate stacked paths
         paths = _generate_stacked_paths(
             x_data, y_series,
@@ -301,34 +288,45 @@ class SVGAreaChartPattern:
             chart_width, chart_height - 40
         )
 
-        # Draw grid lines FIRST so area bands appear in front
-        grid_spacing = 67
-        for i in range(15):
-            x = chart_x + (i * grid_spacing)
-            if x <= chart_x + chart_width:
-                # Dashed vertical line
-                ET.SubElement(svg, 'line', {
-                    'x1': str(x),
-                    'y1': str(chart_start_y),
-                    'x2': str(x),
-                    'y2': str(chart_start_y + chart_height - 40),
-                    'stroke': self.colors['grid'],
-                    'stroke-width': '1',
-                    'stroke-dasharray': '4,4'
-                })
-
-                # X-axis label
-                if i < 14:
-                    label_text = f"{i+1:02d}"
-                    label_elem = ET.SubElement(svg, 'text', {
-                        'x': str(x + 10),
-                        'y': str(chart_start_y + chart_height - 10),
-                        'fill': self.colors['legend_text'],
-                        'font-size': '14',
-                        'font-weight': '400',
-                        'text-anchor': 'middle'
-                    })
-                    label_elem.text = label_text
+        # Only negative values can push a band outside the chart area, so
+        # only then do the bands need clipping
+        band_attrs = {}
+        if _bands_need_clip(y_series):
+            clip_id = "chart-clip-pattern"
+            clipPath = ET.SubElement(defs, 'clipPath', {'id': clip_id})
+            ET.SubElement(clipPath, 'rect', {
+                'x': str(chart_x),
+                'y': str(chart_start_y),
+                'width': str(chart_width),
+                'height': str(chart_height - 40)
+            })
+            band_attrs['clip-path'] = f'url(#{clip_id})'
+
+        # Draw grid lines FIRST so area bands appear in front. Lines and
+        # x-axis labels each take their shared styling from a parent <g>
+        grid_xs = _grid_xs(chart_x, chart_width)
+        line_y1 = str(chart_start_y)
+        line_y2 = str(chart_start_y + chart_height - 40)
+        line_group = ET.SubElement(svg, 'g', {
+            'stroke': self.colors['grid'],
+            'stroke-width': '1',
+            'stroke-dasharray': '4,4'
+        })
+        for x in grid_xs:
+            # Dashed vertical line
+            ET.SubElement(line_group, 'line', {'x1': str(x), 'y1': line_y1, 'x2': str(x), 'y2': line_y2})
+
+        # X-axis labels below chart, beside every grid line but the last
+        label_y = str(chart_start_y + chart_height - 10)
+        label_group = ET.SubElement(svg, 'g', {
+            'fill': self.colors['legend_text'],
+            'font-size': '14',
+            'font-weight': '400',
+            'text-anchor': 'middle'
+        })
+        for i, x in enumerate(grid_xs[:14]):
+            label_elem = ET.SubElement(label_group, 'text', {'x': str(x + 10), 'y': label_y})
+            label_elem.text = f"{i+1:02d}"
 
         # Draw bands with patterns
         # Top band (smallest) - noise pattern
@@ -336,7 +334,7 @@ class SVGAreaChartPattern:
             'd': paths[2][0],
             'fill': 'url(#pattern-top)',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Middle band - diagonal line pattern
@@ -344,7 +342,7 @@ class SVGAreaChartPattern:
             'd': paths[1][0],
             'fill': 'url(#pattern-middle)',
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
         # Bottom band (largest) - lightest (solid light green)
@@ -352,11 +350,9 @@ class SVGAreaChartPattern:
             'd': paths[0][0],
             'fill': self.colors['area'],  # Solid #C5FFC8
             'fill-rule': 'evenodd',
-            'clip-path': f'url(#{clip_id})'
+            **band_attrs
         })
 
     def save_svg(self, svg_string: str, filename: str) -> None:
         """Save SVG string to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
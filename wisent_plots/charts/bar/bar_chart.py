@@ -1,7 +1,9 @@
 """Bar chart implementation with Wisent brand styling."""
 
 from typing import Optional, Union, List, Tuple
-from wisent_plots.styles.style_config import get_style
+from wisent_plots.charts._util import resolve_style
+from wisent_plots.charts.svg_cache import cache_svg
+from wisent_plots.charts.svg_io import write_svg
 from wisent_plots.charts.bar.svg_bar_chart import SVGBarChart
 
 
@@ -40,6 +42,28 @@ class BarChart:
             width: Chart width in pixels (default: 1002)
             height: Chart height in pixels (default: 499)
         """
+        self.style_number, self.theme = self._resolve_style_config(style, theme)
+        self.width = width
+        self.height = height
+
+    def set_style(self, style: Union[int, str]) -> None:
+        """Switch the chart to a different style without rebuilding it.
+
+        Args:
+            style: Style number (1-5) for different pattern combinations.
+
+        Raises:
+            ValueError: If style is not between 1 and 5.
+        """
+        self.style_number, self.theme = self._resolve_style_config(style, self.theme)
+
+    @classmethod
+    def _resolve_style_config(cls, style: Union[int, str], theme: str) -> Tuple[int, str]:
+        """Resolve and validate a style number or name and a theme name.
+
+        Returns:
+            Tuple of (style_number, theme)
+        """
         # Map style names to numbers
         style_map = {
             "solid": 1,
@@ -49,26 +73,15 @@ class BarChart:
             "multicolor": 5,
         }
 
-        # Convert style name to number if needed
-        if isinstance(style, str):
-            style_lower = style.lower()
-            if style_lower in style_map:
-                self.style_number = style_map[style_lower]
-            else:
-                raise ValueError(f"Unknown style name: {style}. Valid names are: {', '.join(style_map.keys())}")
-        else:
-            self.style_number = style
-
-        if self.style_number < 1 or self.style_number > 5:
-            raise ValueError(f"Style must be between 1 and 5, got {self.style_number}")
-
-        self.theme = theme.lower()
-        if self.theme not in ['brand', 'black', 'white']:
+        style_number = resolve_style(style, style_map, max_num=5)
+
+        theme_lower = theme.lower()
+        if theme_lower not in ['brand', 'black', 'white']:
             raise ValueError(f"Theme must be 'brand', 'black', or 'white', got {theme}")
 
-        self.width = width
-        self.height = height
+        return style_number, theme_lower
 
+    @cache_svg
     def plot(
         self,
         categories: List[str],
@@ -113,3 +126,12 @@ class BarChart:
             labels,
             title or "Bar Chart"
         )
+
+    def save_svg(self, svg_string: str, filename: str):
+        """Save SVG string to file.
+
+        Args:
+            svg_string: SVG content as string
+            filename: Output filename
+        """
+        write_svg(svg_string, filename)
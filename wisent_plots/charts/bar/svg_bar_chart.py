@@ -142,9 +142,8 @@ class SVGBarChart:
 
     def _create_patterns(self, svg):
         """Create SVG pattern definitions based on style."""
-        defs = svg.find('defs')
-        if defs is None:
-            defs = ET.SubElement(svg, 'defs')
+        # create_chart builds a fresh root, so there is never an existing <defs>
+        defs = ET.SubElement(svg, 'defs')
 
         # Get path to assets directory
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -337,17 +336,28 @@ class SVGBarChart:
         # Get fills
         fills = self._get_segment_fills()
 
+        # Attributes shared by every label or segment are set once on a
+        # parent <g> rather than repeated on each element
+        label_group = ET.SubElement(svg, 'g', {
+            'fill': self.colors['legend_text'],
+            'font-size': '14',
+            'font-weight': '400'
+        })
+        segment_groups = [
+            ET.SubElement(svg, 'g', {
+                'fill': fills[seg_idx] if seg_idx < len(fills) else self.colors['bar_one']
+            })
+            for seg_idx in range(len(series))
+        ]
+
         # Render each category (row)
         for cat_idx, category in enumerate(categories):
             y = chart_start_y + cat_idx * (bar_height + bar_spacing)
 
             # Category label
-            label_elem = ET.SubElement(svg, 'text', {
+            label_elem = ET.SubElement(label_group, 'text', {
                 'x': str(chart_x),
-                'y': str(y + bar_height // 2 + 5),
-                'fill': self.colors['legend_text'],
-                'font-size': '14',
-                'font-weight': '400'
+                'y': str(y + bar_height // 2 + 5)
             })
             label_elem.text = category
 
@@ -361,15 +371,12 @@ class SVGBarChart:
                 value = segment_series[cat_idx]
                 segment_width = (value / max_value) * available_width
 
-                fill = fills[seg_idx] if seg_idx < len(fills) else self.colors['bar_one']
-
                 # Draw segment
-                ET.SubElement(svg, 'rect', {
+                ET.SubElement(segment_groups[seg_idx], 'rect', {
                     'x': str(current_x),
                     'y': str(y),
                     'width': str(segment_width),
-                    'height': str(bar_height),
-                    'fill': fill
+                    'height': str(bar_height)
                 })
 
                 current_x += segment_width
@@ -377,16 +384,18 @@ class SVGBarChart:
         # X-axis labels (scale)
         axis_y = chart_start_y + num_categories * (bar_height + bar_spacing) + 10
         num_ticks = 9
+        tick_group = ET.SubElement(svg, 'g', {
+            'fill': self.colors['legend_text'],
+            'font-size': '12',
+            'font-weight': '400',
+            'text-anchor': 'middle'
+        })
         for i in range(num_ticks):
             tick_x = chart_x + 120 + i * (chart_width - 120) / (num_ticks - 1)
             tick_value = int((i / (num_ticks - 1)) * max_value)
 
-            tick_elem = ET.SubElement(svg, 'text', {
+            tick_elem = ET.SubElement(tick_group, 'text', {
                 'x': str(tick_x),
-                'y': str(axis_y),
-                'fill': self.colors['legend_text'],
-                'font-size': '12',
-                'font-weight': '400',
-                'text-anchor': 'middle'
+                'y': str(axis_y)
             })
             tick_elem.text = str(tick_value)
@@ -1,9 +1,11 @@
 """Bubble chart implementation with Wisent brand styling."""
 
-from typing import Optional, Union, List, Tuple
-import numpy as np
+from typing import Any, Dict, Optional, Union, List, Tuple
 
 from wisent_plots.styles.style_config import get_style
+from wisent_plots.charts._util import resolve_style
+from wisent_plots.charts.svg_cache import cache_svg
+from wisent_plots.charts.svg_io import write_svg
 from wisent_plots.charts.bubble.svg_bubble_chart import SVGBubbleChart
 from wisent_plots.charts.bubble.svg_radar_bubble_chart import SVGRadarBubbleChart
 
@@ -43,22 +45,7 @@ class BubbleChart:
         Raises:
             ValueError: If style is not between 1 and 3 or chart_type is invalid.
         """
-        # Map style names to numbers
-        style_map = {
-            "brand": 1,
-            "black": 2,
-            "white": 3,
-        }
-
-        # Convert style name to number if needed
-        if isinstance(style, str):
-            style_lower = style.lower()
-            if style_lower in style_map:
-                self.style_number = style_map[style_lower]
-            else:
-                raise ValueError(f"Unknown style name: {style}. Valid names are: {', '.join(style_map.keys())}")
-        else:
-            self.style_number = style
+        self.style_number, self.style_config = self._resolve_style_config(style)
 
         if chart_type not in ['bubble', 'radar']:
             raise ValueError("chart_type must be 'bubble' or 'radar'")
@@ -67,15 +54,38 @@ class BubbleChart:
         self.width = width
         self.height = height
 
+    def set_style(self, style: Union[int, str]) -> None:
+        """Switch the chart to a different style without rebuilding it.
+
+        Args:
+            style: Style number (1-3) for bubble charts.
+
+        Raises:
+            ValueError: If style is not between 1 and 3.
+        """
+        self.style_number, self.style_config = self._resolve_style_config(style)
+
+    @classmethod
+    def _resolve_style_config(cls, style: Union[int, str]) -> Tuple[int, Dict[str, Any]]:
+        """Resolve a style number or name to (style_number, style_config)."""
+        # Map style names to numbers
+        style_map = {
+            "brand": 1,
+            "black": 2,
+            "white": 3,
+        }
+
+        style_number = resolve_style(style, style_map)
+
         # Map bubble chart styles to actual style numbers (30, 31, 32)
-        actual_style = 29 + self.style_number
+        actual_style = 29 + style_number
 
         # Load style configuration
         try:
-            self.style_config = get_style(actual_style)
+            style_config = get_style(actual_style)
         except ValueError:
             # Fallback if style doesn't exist
-            self.style_config = {
+            style_config = {
                 "colors": {
                     "primary": "#FA5A46",
                     "secondary": "#FF8C00",
@@ -92,6 +102,9 @@ class BubbleChart:
                 },
             }
 
+        return style_number, style_config
+
+    @cache_svg
     def plot(
         self,
         x_data: Optional[List[float]] = None,
@@ -145,12 +158,7 @@ class BubbleChart:
         title: str
     ) -> str:
         """Create regular bubble chart SVG."""
-        svg_chart = SVGBubbleChart(width=self.width, height=self.height)
-
-        # Update colors from style config
-        self._update_chart_colors(svg_chart)
-
-        svg_string = svg_chart.create_chart(
+        svg_string = self._bubble_renderer().create_chart(
             x_data=x_data,
             y_data=y_data,
             sizes=sizes,
@@ -161,6 +169,15 @@ class BubbleChart:
 
         return svg_string
 
+    def _bubble_renderer(self) -> SVGBubbleChart:
+        """Return a regular bubble chart renderer in this chart's colors."""
+        svg_chart = SVGBubbleChart(width=self.width, height=self.height)
+
+        # Update colors from style config
+        self._update_chart_colors(svg_chart)
+
+        return svg_chart
+
     def _create_radar_svg(
         self,
         angles: List[float],
@@ -200,9 +217,50 @@ class BubbleChart:
             color_key = f'bubble{i}'
             if color_key in self.style_config['colors']:
                 svg_chart.colors[color_key] = self.style_config['colors'][color_key]
+        svg_chart.update_bubble_palette()
 
     def save_svg(self, svg_string: str, filename: str):
         """Save SVG to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
+
+    def save_chart(
+        self,
+        filename: str,
+        x_data: Optional[List[float]] = None,
+        y_data: Optional[List[float]] = None,
+        sizes: List[float] = None,
+        categories: Optional[List[int]] = None,
+        category_labels: Optional[List[str]] = None,
+        title: str = "Bubble Chart",
+        angles: Optional[List[float]] = None,
+        distances: Optional[List[float]] = None
+    ) -> None:
+        """Render a chart straight to a file.
+
+        Regular bubble charts are written as they are generated, without
+        building the SVG string. Radar charts are rendered with plot and
+        then saved.
+
+        Args:
+            filename: Output filename (``.svgz`` is gzip-compressed)
+            x_data, y_data, sizes, categories, category_labels, title,
+            angles, distances: Chart data, as for plot
+        """
+        if self.chart_type == 'radar':
+            self.save_svg(
+                self.plot(
+                    sizes=sizes, categories=categories, category_labels=category_labels,
+                    title=title, angles=angles, distances=distances
+                ),
+                filename
+            )
+        else:
+            self._bubble_renderer().save_chart(
+                filename,
+                x_data=x_data,
+                y_data=y_data,
+                sizes=sizes,
+                categories=categories,
+                category_labels=category_labels,
+                title=title
+            )
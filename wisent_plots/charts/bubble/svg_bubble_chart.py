@@ -1,9 +1,21 @@
 """SVG-based bubble chart for pixel-perfect Figma matching."""
 
-from typing import List, Optional
-import xml.etree.ElementTree as ET
+from typing import List, Optional, TextIO
 import numpy as np
 
+from wisent_plots.charts.svg_io import open_svg, write_svg
+from wisent_plots.charts.svg_markup import STYLE_MARKUP, SVGWriter, escape_text
+
+
+def _normalize(values: List[float]) -> np.ndarray:
+    """Scale values to 0-1 by their min and max; a constant series maps to 0.5."""
+    arr = np.asarray(values, dtype=np.float64)
+    lo = arr.min()
+    span = arr.max() - lo
+    if span == 0:
+        return np.full(arr.shape, 0.5)
+    return (arr - lo) / span
+
 
 class SVGBubbleChart:
     """Generate pixel-perfect SVG bubble charts matching Figma design."""
@@ -36,6 +48,7 @@ class SVGBubbleChart:
             'bubble8': '#FFB6C1',  # Light pink
             'bubble9': '#A9A9A9',  # Gray
         }
+        self.update_bubble_palette()
 
         # Chart dimensions
         self.padding_x = 32
@@ -44,6 +57,32 @@ class SVGBubbleChart:
         self.legend_gap = 8
         self.chart_top_margin = 60
 
+    def update_bubble_palette(self):
+        """Rebuild the bubble color list from self.colors.
+
+        Call this after changing any of the bubble1-bubble9 colors.
+        """
+        self._bubble_palette = [self.colors[f'bubble{i}'] for i in range(1, 10)]
+
+    def _bubble_color(self, cat_idx: int) -> str:
+        """Return the color for a category; out-of-range categories use bubble9."""
+        palette = self._bubble_palette
+        return palette[cat_idx] if 0 <= cat_idx < len(palette) else palette[-1]
+
+    def _point_colors(self, categories: Optional[List[int]], count: int) -> List[str]:
+        """Resolve one color per point before drawing.
+
+        Points without a category (or all points, if none are given) use bubble1.
+        """
+        palette = self._bubble_palette
+        num_colors = len(palette)
+        colors = [
+            palette[cat_idx] if 0 <= cat_idx < num_colors else palette[-1]
+            for cat_idx in (categories or [])[:count]
+        ]
+        colors.extend([palette[0]] * (count - len(colors)))
+        return colors
+
     def create_chart(
         self,
         x_data: List[float],
@@ -72,8 +111,41 @@ class SVGBubbleChart:
         Returns:
             SVG string
         """
+        # Markup is written straight to a string buffer; no element tree
+        svg = SVGWriter()
+        self._write_chart(
+            svg, x_data, y_data, sizes, categories, category_labels,
+            title, x_label, y_label, size_range
+        )
+        return svg.getvalue()
+
+    def create_chart_stream(self, out: TextIO, *args, **kwargs) -> None:
+        """Write the SVG bubble chart to a text stream as it is generated.
+
+        Unlike create_chart, the whole document is never held in memory.
+
+        Args:
+            out: Text stream to write the SVG markup to
+            *args, **kwargs: Chart arguments, as for create_chart
+        """
+        self._write_chart(SVGWriter(out), *args, **kwargs)
+
+    def _write_chart(
+        self,
+        svg: SVGWriter,
+        x_data: List[float],
+        y_data: List[float],
+        sizes: List[float],
+        categories: Optional[List[str]] = None,
+        category_labels: Optional[List[str]] = None,
+        title: str = "Bubble Chart",
+        x_label: str = "",
+        y_label: str = "",
+        size_range: tuple = (5, 20)
+    ) -> None:
+        """Write the whole chart to svg; see create_chart for the arguments."""
         # Create SVG root
-        svg = ET.Element('svg', {
+        svg.start('svg', {
             'width': str(self.width),
             'height': str(self.height),
             'xmlns': 'http://www.w3.org/2000/svg',
@@ -81,15 +153,11 @@ class SVGBubbleChart:
         })
 
         # Add Hubot Sans font
-        style = ET.SubElement(svg, 'style')
-        style.text = """
-            @import url('https://fonts.googleapis.com/css2?family=Hubot+Sans:wght@400&display=swap');
-            text { font-family: 'Hubot Sans', sans-serif; }
-        """
+        svg.raw(STYLE_MARKUP)
 
         # Background with rounded corners
-        bg_color = self.colors.get('background', '#121212')
-        ET.SubElement(svg, 'rect', {
+        bg_color = self.colors['background']
+        svg.element('rect', {
             'width': str(self.width),
             'height': str(self.height),
             'fill': bg_color,
@@ -98,21 +166,22 @@ class SVGBubbleChart:
         })
 
         # Render title
+        # Numbers and theme colors are written as-is; only user-supplied
+        # text (the title and legend labels) needs escaping
         title_y = self.padding_y + 20
-        title_elem = ET.SubElement(svg, 'text', {
-            'x': str(self.padding_x),
-            'y': str(title_y),
-            'fill': self.colors['title'],
-            'font-size': '20',
-            'font-weight': '400'
-        })
-        title_elem.text = title
+        svg.raw(
+            f'<text x="{self.padding_x}" y="{title_y}" fill="{self.colors["title"]}" '
+            f'font-size="20" font-weight="400">{escape_text(title)}</text>'
+        )
 
         # Render legend if category labels provided
         # Only show labels for categories that are actually used in the data
         if category_labels and categories:
-            unique_categories = sorted(set(categories))
-            filtered_labels = [category_labels[i] for i in unique_categories if i < len(category_labels)]
+            # np.unique sorts and dedupes in one C pass, so the label filter
+            # only walks the few distinct categories
+            unique_categories = np.unique(np.asarray(categories)).tolist()
+            num_labels = len(category_labels)
+            filtered_labels = [category_labels[i] for i in unique_categories if i < num_labels]
             self._render_legend(svg, filtered_labels, unique_categories)
         elif category_labels:
             self._render_legend(svg, category_labels, None)
@@ -132,19 +201,22 @@ class SVGBubbleChart:
             chart_x, chart_y, chart_width, chart_height, size_range
         )
 
-        # Convert to string
-        return ET.tostring(svg, encoding='unicode', method='xml')
+        svg.end('svg')
 
     def _render_legend(self, svg, labels: List[str], category_indices: Optional[List[int]] = None):
         """Render horizontal legend below title.
 
         Args:
-            svg: SVG element to add legend to
+            svg: SVGWriter to write the legend to
             labels: Labels to display
             category_indices: Optional list of category indices (for proper color mapping)
         """
+        if not labels:
+            return
+
         legend_y = self.padding_y + 36
         legend_x = self.padding_x
+        text_color = self.colors['legend_text']
 
         for i, label in enumerate(labels):
             # Color box - use category index if provided, otherwise use label index
@@ -152,86 +224,77 @@ class SVGBubbleChart:
                 cat_idx = category_indices[i]
             else:
                 cat_idx = i
-            color_key = f'bubble{cat_idx+1}'
-            color = self.colors.get(color_key, self.colors['bubble9'])
-
-            ET.SubElement(svg, 'rect', {
-                'x': str(legend_x),
-                'y': str(legend_y),
-                'width': '20',
-                'height': '10',
-                'fill': color,
-                'rx': '2',
-                'ry': '2'
-            })
+            color = self._bubble_color(cat_idx)
+
+            svg.raw(
+                f'<rect x="{legend_x}" y="{legend_y}" width="20" height="10" '
+                f'fill="{color}" rx="2" ry="2" />'
+            )
 
             # Label text
-            text_elem = ET.SubElement(svg, 'text', {
-                'x': str(legend_x + 28),
-                'y': str(legend_y + 9),
-                'fill': self.colors['legend_text'],
-                'font-size': '12',
-                'font-weight': '400'
-            })
-            text_elem.text = label
+            svg.raw(
+                f'<text x="{legend_x + 28}" y="{legend_y + 9}" fill="{text_color}" '
+                f'font-size="12" font-weight="400">{escape_text(label)}</text>'
+            )
 
             # Move to next position
             legend_x += 60
 
     def _render_grid(self, svg, x: int, y: int, width: int, height: int):
         """Render grid lines and axis labels."""
-        # Horizontal grid lines
         num_h_lines = 5
-        for i in range(num_h_lines + 1):
-            y_pos = y + (i * height / num_h_lines)
-            ET.SubElement(svg, 'line', {
-                'x1': str(x),
-                'y1': str(y_pos),
-                'x2': str(x + width),
-                'y2': str(y_pos),
-                'stroke': self.colors['grid'],
-                'stroke-width': '1',
-                'opacity': '0.3'
-            })
-
-            # Y-axis labels
-            value = 1000 - (i * 200)
-            text_elem = ET.SubElement(svg, 'text', {
-                'x': str(x - 10),
-                'y': str(y_pos + 5),
-                'fill': self.colors['axis_text'],
-                'font-size': '12',
-                'font-weight': '400',
-                'text-anchor': 'end'
-            })
-            text_elem.text = str(value)
-
-        # Vertical grid lines
         num_v_lines = 5
-        for i in range(num_v_lines + 1):
-            x_pos = x + (i * width / num_v_lines)
-            ET.SubElement(svg, 'line', {
-                'x1': str(x_pos),
-                'y1': str(y),
-                'x2': str(x_pos),
-                'y2': str(y + height),
-                'stroke': self.colors['grid'],
-                'stroke-width': '1',
-                'opacity': '0.3'
-            })
-
-            # X-axis labels
-            if i < num_v_lines:
-                value = i * 20 + 10
-                text_elem = ET.SubElement(svg, 'text', {
-                    'x': str(x_pos + width / num_v_lines / 2),
-                    'y': str(y + height + 20),
-                    'fill': self.colors['axis_text'],
-                    'font-size': '12',
-                    'font-weight': '400',
-                    'text-anchor': 'middle'
-                })
-                text_elem.text = f"{value:02d}"
+        y_positions = [y + (i * height / num_h_lines) for i in range(num_h_lines + 1)]
+        x_positions = [x + (i * width / num_v_lines) for i in range(num_v_lines + 1)]
+
+        # Grid lines share their stroke in one group. stroke-opacity rather
+        # than opacity keeps each line's transparency separate where they cross
+        svg.start('g', {
+            'stroke': self.colors['grid'],
+            'stroke-width': '1',
+            'stroke-opacity': '0.3'
+        })
+
+        # Grid lines and labels hold only numbers, so each run of them is
+        # formatted and written as a single string
+        y_end = y + height
+        x_end = x + width
+        svg.raw("".join(
+            f'<line x1="{x}" y1="{y_pos:.2f}" x2="{x_end}" y2="{y_pos:.2f}" />'
+            for y_pos in y_positions
+        ))
+        svg.raw("".join(
+            f'<line x1="{x_pos:.2f}" y1="{y}" x2="{x_pos:.2f}" y2="{y_end}" />'
+            for x_pos in x_positions
+        ))
+        svg.end('g')
+
+        # Y-axis labels, from 1000 at the top down to 0
+        svg.start('g', {
+            'fill': self.colors['axis_text'],
+            'font-size': '12',
+            'font-weight': '400',
+            'text-anchor': 'end'
+        })
+        svg.raw("".join(
+            f'<text x="{x - 10}" y="{y_pos + 5:.2f}">{1000 - i * 200}</text>'
+            for i, y_pos in enumerate(y_positions)
+        ))
+        svg.end('g')
+
+        # X-axis labels, centred in each column
+        svg.start('g', {
+            'fill': self.colors['axis_text'],
+            'font-size': '12',
+            'font-weight': '400',
+            'text-anchor': 'middle'
+        })
+        half_column = width / num_v_lines / 2
+        svg.raw("".join(
+            f'<text x="{x_pos + half_column:.2f}" y="{y_end + 20}">{i * 20 + 10:02d}</text>'
+            for i, x_pos in enumerate(x_positions[:-1])
+        ))
+        svg.end('g')
 
     def _render_bubbles(
         self,
@@ -247,45 +310,38 @@ class SVGBubbleChart:
         size_range: tuple
     ):
         """Render bubbles on the chart."""
-        # Normalize data
-        x_min, x_max = min(x_data), max(x_data)
-        y_min, y_max = min(y_data), max(y_data)
-        size_min, size_max = min(sizes), max(sizes)
+        # Nothing to scale; the chart keeps its grid and axes
+        if len(x_data) == 0:
+            return
 
         min_r, max_r = size_range
 
-        for i, (x, y, size) in enumerate(zip(x_data, y_data, sizes)):
-            # Normalize positions
-            x_norm = (x - x_min) / (x_max - x_min) if x_max != x_min else 0.5
-            y_norm = (y - y_min) / (y_max - y_min) if y_max != y_min else 0.5
-
-            # Calculate pixel positions (invert Y axis)
-            x_pos = chart_x + x_norm * chart_width
-            y_pos = chart_y + chart_height - (y_norm * chart_height)
-
-            # Calculate radius
-            size_norm = (size - size_min) / (size_max - size_min) if size_max != size_min else 0.5
-            radius = min_r + size_norm * (max_r - min_r)
-
-            # Get color based on category
-            if categories and i < len(categories):
-                cat_idx = categories[i]
-                color_key = f'bubble{cat_idx + 1}'
-                color = self.colors.get(color_key, self.colors['bubble9'])
-            else:
-                color = self.colors['bubble1']
-
-            # Draw bubble
-            ET.SubElement(svg, 'circle', {
-                'cx': str(x_pos),
-                'cy': str(y_pos),
-                'r': str(radius),
-                'fill': color,
-                'opacity': '0.7'
-            })
+        # Calculate pixel positions (invert Y axis) and radii for every point
+        # at once; the loop below only writes markup
+        x_positions = chart_x + _normalize(x_data) * chart_width
+        y_positions = chart_y + chart_height - _normalize(y_data) * chart_height
+        radii = min_r + _normalize(sizes) * (max_r - min_r)
+
+        # fill-opacity is set once on the group; unlike a group opacity it
+        # still lets overlapping bubbles show through each other
+        svg.start('g', {'fill-opacity': '0.7'})
+        for x_pos, y_pos, radius, color in zip(
+            x_positions.tolist(), y_positions.tolist(), radii.tolist(),
+            self._point_colors(categories, len(x_data))
+        ):
+            svg.raw(f'<circle cx="{x_pos:.2f}" cy="{y_pos:.2f}" r="{radius:.2f}" fill="{color}" />')
+        svg.end('g')
 
     def save_svg(self, svg_string: str, filename: str):
         """Save SVG to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
+
+    def save_chart(self, filename: str, *args, **kwargs):
+        """Render a chart straight to a file without building the SVG string.
+
+        Args:
+            filename: Output filename
+            *args, **kwargs: Chart arguments, as for create_chart
+        """
+        with open_svg(filename) as out:
+            self.create_chart_stream(out, *args, **kwargs)
@@ -5,6 +5,8 @@ import xml.etree.ElementTree as ET
 import numpy as np
 import math
 
+from wisent_plots.charts.svg_io import write_svg
+
 
 class SVGRadarBubbleChart:
     """Generate pixel-perfect SVG radar/spider bubble charts matching Figma design."""
@@ -38,6 +40,7 @@ class SVGRadarBubbleChart:
             'bubble8': '#FFB6C1',  # Light pink
             'bubble9': '#A9A9A9',  # Gray
         }
+        self.update_bubble_palette()
 
         # Chart dimensions
         self.padding_x = 32
@@ -46,6 +49,32 @@ class SVGRadarBubbleChart:
         self.legend_gap = 8
         self.chart_top_margin = 60
 
+    def update_bubble_palette(self):
+        """Rebuild the bubble color list from self.colors.
+
+        Call this after changing any of the bubble1-bubble9 colors.
+        """
+        self._bubble_palette = [self.colors[f'bubble{i}'] for i in range(1, 10)]
+
+    def _bubble_color(self, cat_idx: int) -> str:
+        """Return the color for a category; out-of-range categories use bubble9."""
+        palette = self._bubble_palette
+        return palette[cat_idx] if 0 <= cat_idx < len(palette) else palette[-1]
+
+    def _point_colors(self, categories: Optional[List[int]], count: int) -> List[str]:
+        """Resolve one color per point before drawing.
+
+        Points without a category (or all points, if none are given) use bubble1.
+        """
+        palette = self._bubble_palette
+        num_colors = len(palette)
+        colors = [
+            palette[cat_idx] if 0 <= cat_idx < num_colors else palette[-1]
+            for cat_idx in (categories or [])[:count]
+        ]
+        colors.extend([palette[0]] * (count - len(colors)))
+        return colors
+
     def create_chart(
         self,
         angles: List[float],
@@ -90,7 +119,7 @@ class SVGRadarBubbleChart:
         """
 
         # Background with rounded corners
-        bg_color = self.colors.get('background', '#121212')
+        bg_color = self.colors['background']
         ET.SubElement(svg, 'rect', {
             'width': str(self.width),
             'height': str(self.height),
@@ -113,8 +142,11 @@ class SVGRadarBubbleChart:
         # Render legend if category labels provided
         # Only show labels for categories that are actually used in the data
         if category_labels and categories:
-            unique_categories = sorted(set(categories))
-            filtered_labels = [category_labels[i] for i in unique_categories if i < len(category_labels)]
+            # np.unique sorts and dedupes in one C pass, so the label filter
+            # only walks the few distinct categories
+            unique_categories = np.unique(np.asarray(categories)).tolist()
+            num_labels = len(category_labels)
+            filtered_labels = [category_labels[i] for i in unique_categories if i < num_labels]
             self._render_legend(svg, filtered_labels, unique_categories)
         elif category_labels:
             self._render_legend(svg, category_labels, None)
@@ -144,21 +176,28 @@ class SVGRadarBubbleChart:
             labels: Labels to display
             category_indices: Optional list of category indices (for proper color mapping)
         """
+        if not labels:
+            return
+
         legend_y = self.padding_y + 36
         legend_x = self.padding_x
 
+        # Strings shared by every legend item are built once
+        box_y = str(legend_y)
+        text_y = str(legend_y + 9)
+        text_color = self.colors['legend_text']
+
         for i, label in enumerate(labels):
             # Color box - use category index if provided, otherwise use label index
             if category_indices and i < len(category_indices):
                 cat_idx = category_indices[i]
             else:
                 cat_idx = i
-            color_key = f'bubble{cat_idx+1}'
-            color = self.colors.get(color_key, self.colors['bubble9'])
+            color = self._bubble_color(cat_idx)
 
             ET.SubElement(svg, 'rect', {
                 'x': str(legend_x),
-                'y': str(legend_y),
+                'y': box_y,
                 'width': '20',
                 'height': '10',
                 'fill': color,
@@ -169,8 +208,8 @@ class SVGRadarBubbleChart:
             # Label text
             text_elem = ET.SubElement(svg, 'text', {
                 'x': str(legend_x + 28),
-                'y': str(legend_y + 9),
-                'fill': self.colors['legend_text'],
+                'y': text_y,
+                'fill': text_color,
                 'font-size': '12',
                 'font-weight': '400'
             })
@@ -181,15 +220,22 @@ class SVGRadarBubbleChart:
 
     def _render_radar_grid(self, svg, cx: float, cy: float, max_r: float, num_rings: int, num_axes: int):
         """Render concentric circles and radial axes."""
+        # Strings shared by every ring and axis are built once
+        cx_str = str(cx)
+        cy_str = str(cy)
+        grid_color = self.colors['grid']
+        axis_line_color = self.colors['axis_line']
+        axis_text_color = self.colors['axis_text']
+
         # Draw concentric circles
         for i in range(1, num_rings + 1):
             radius = (i / num_rings) * max_r
             ET.SubElement(svg, 'circle', {
-                'cx': str(cx),
-                'cy': str(cy),
+                'cx': cx_str,
+                'cy': cy_str,
                 'r': str(radius),
                 'fill': 'none',
-                'stroke': self.colors['grid'],
+                'stroke': grid_color,
                 'stroke-width': '1',
                 'opacity': '0.3'
             })
@@ -199,9 +245,9 @@ class SVGRadarBubbleChart:
                 label_y = cy - radius - 5
                 value = i * 20  # 0, 20, 40, 60, 80, 100
                 text_elem = ET.SubElement(svg, 'text', {
-                    'x': str(cx),
+                    'x': cx_str,
                     'y': str(label_y),
-                    'fill': self.colors['axis_text'],
+                    'fill': axis_text_color,
                     'font-size': '10',
                     'font-weight': '400',
                     'text-anchor': 'middle'
@@ -219,11 +265,11 @@ class SVGRadarBubbleChart:
 
             # Draw axis line
             ET.SubElement(svg, 'line', {
-                'x1': str(cx),
-                'y1': str(cy),
+                'x1': cx_str,
+                'y1': cy_str,
                 'x2': str(end_x),
                 'y2': str(end_y),
-                'stroke': self.colors['axis_line'],
+                'stroke': axis_line_color,
                 'stroke-width': '1',
                 'opacity': '0.5'
             })
@@ -245,7 +291,7 @@ class SVGRadarBubbleChart:
             text_elem = ET.SubElement(svg, 'text', {
                 'x': str(label_x),
                 'y': str(label_y),
-                'fill': self.colors['axis_text'],
+                'fill': axis_text_color,
                 'font-size': '12',
                 'font-weight': '400',
                 'text-anchor': text_anchor
@@ -265,11 +311,17 @@ class SVGRadarBubbleChart:
         size_range: tuple
     ):
         """Render bubbles on the radar chart."""
+        # Nothing to scale; the chart keeps its rings and axes
+        if len(angles) == 0:
+            return
+
         # Normalize sizes
         size_min, size_max = min(sizes), max(sizes)
         min_r, max_r = size_range
 
-        for i, (angle, distance, size) in enumerate(zip(angles, distances, sizes)):
+        point_colors = self._point_colors(categories, len(angles))
+
+        for angle, distance, size, color in zip(angles, distances, sizes, point_colors):
             # Convert angle to radians (0 degrees = top, clockwise)
             angle_rad = math.radians(angle - 90)
 
@@ -282,14 +334,6 @@ class SVGRadarBubbleChart:
             size_norm = (size - size_min) / (size_max - size_min) if size_max != size_min else 0.5
             bubble_radius = min_r + size_norm * (max_r - min_r)
 
-            # Get color based on category
-            if categories and i < len(categories):
-                cat_idx = categories[i]
-                color_key = f'bubble{cat_idx + 1}'
-                color = self.colors.get(color_key, self.colors['bubble9'])
-            else:
-                color = self.colors['bubble1']
-
             # Draw bubble
             ET.SubElement(svg, 'circle', {
                 'cx': str(x_pos),
@@ -301,6 +345,4 @@ class SVGRadarBubbleChart:
 
     def save_svg(self, svg_string: str, filename: str):
         """Save SVG to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
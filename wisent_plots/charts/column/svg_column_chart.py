@@ -1,9 +1,134 @@
 """SVG grouped column chart with pattern fills matching Figma designs."""
 
+import functools
+from collections import deque
+from itertools import accumulate
+from types import MappingProxyType
 import xml.etree.ElementTree as ET
-from typing import List
+from typing import List, Sequence, Tuple, Union
 import os
 
+import numpy as np
+
+from wisent_plots.charts.svg_markup import SVG_HEADER_TMPL, SVGWriter, escape_attr, escape_text
+
+# Pattern assets, resolved once at import
+_ASSETS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets'
+)
+_NOISE_PATTERN_PATH = os.path.join(_ASSETS_DIR, 'large', 'noise_rectangle_large.svg')
+_CROSSING_PATTERN_PATH = os.path.join(_ASSETS_DIR, 'pattern_crossing_lines.svg')
+_DITHER_PATTERN_PATH = os.path.join(_ASSETS_DIR, 'large', 'dither_cross_large.svg')
+
+# Fixed column width and the space between columns in a group
+_COLUMN_WIDTH = 40
+_COLUMN_SPACING = 10
+
+
+# Color schemes per theme. Unknown themes fall back to 'white'. The
+# mappings are read-only because every chart instance shares them.
+_THEMES = {
+    'brand': MappingProxyType({
+        'background': '#121212',
+        'title': '#C5FFC8',
+        'legend_text': '#769978',
+        'grid': '#2D3130',
+        'column_one': '#C5FFC8',      # Lightest green
+        'column_two': '#90B892',      # Medium green
+        'column_three': '#5A715B',    # Dark green
+        # Multi-color style
+        'column_multi_one': '#C5FFC8',   # Green
+        'column_multi_two': '#FF4444',    # Red
+        'column_multi_three': '#B19CD9',  # Purple
+    }),
+    'black': MappingProxyType({
+        'background': '#121212',
+        'title': '#FFFFFF',
+        'legend_text': '#999999',
+        'grid': '#2D3130',
+        'column_one': '#FFFFFF',      # White
+        'column_two': '#808080',      # Medium gray
+        'column_three': '#4D4D4D',    # Dark gray
+        # Multi-color style
+        'column_multi_one': '#C5FFC8',   # Green
+        'column_multi_two': '#FF4444',    # Red
+        'column_multi_three': '#B19CD9',  # Purple
+    }),
+    'white': MappingProxyType({
+        'background': '#FFFFFF',
+        'title': '#000000',
+        'legend_text': '#666666',
+        'grid': '#E0E0E0',
+        'column_one': '#000000',      # Black
+        'column_two': '#808080',      # Medium gray
+        'column_three': '#CCCCCC',    # Light gray
+        # Multi-color style
+        'column_multi_one': '#C5FFC8',   # Green
+        'column_multi_two': '#FF4444',    # Red
+        'column_multi_three': '#B19CD9',  # Purple
+    }),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pattern(pattern_id: str, svg_file: str) -> str:
+    """Load an SVG pattern from a file and return its <pattern> markup.
+
+    Parsing and copying the assets is the most expensive part of a chart,
+    so each (pattern_id, file) pair is done once per process.
+    """
+    pattern_tree = ET.parse(svg_file)
+    pattern_root = pattern_tree.getroot()
+
+    # Extract width and height
+    width = pattern_root.get('width')
+    height = pattern_root.get('height')
+    viewBox = pattern_root.get('viewBox')
+
+    if viewBox:
+        viewBox_parts = viewBox.split()
+        if len(viewBox_parts) == 4:
+            width = viewBox_parts[2]
+            height = viewBox_parts[3]
+
+    # Create pattern element
+    pattern_elem = ET.Element('pattern', {
+        'id': pattern_id,
+        'patternUnits': 'userSpaceOnUse',
+        'width': width,
+        'height': height
+    })
+
+    # Copy all child elements from the pattern SVG
+    for child in pattern_root:
+        if child.tag.rpartition('}')[2] in ('title', 'desc', 'metadata'):
+            continue
+        _copy_element(child, pattern_elem)
+
+    return ET.tostring(pattern_elem, encoding='unicode')
+
+
+def _copy_element(source, parent):
+    """Copy an element and its descendants under parent, dropping namespaces.
+
+    Walks the tree with an explicit stack rather than recursing. Children
+    are pushed in reverse so they are popped, and attached, in order.
+    """
+    stack = deque([(source, parent)])
+    while stack:
+        src, dest_parent = stack.pop()
+
+        # rpartition leaves un-namespaced names as they are, so no prefix
+        # check is needed per tag or attribute
+        attribs = {key.rpartition('}')[2]: value for key, value in src.attrib.items()}
+        new_elem = ET.SubElement(dest_parent, src.tag.rpartition('}')[2], attribs)
+        if src.text is not None:
+            new_elem.text = src.text
+        if src.tail is not None:
+            new_elem.tail = src.tail
+
+        stack.extend((child, new_elem) for child in reversed(src))
+
 
 class SVGColumnChart:
     """Create pixel-perfect SVG grouped column charts with patterns."""
@@ -34,48 +159,7 @@ class SVGColumnChart:
 
     def _set_theme_colors(self):
         """Set color scheme based on theme."""
-        if self.theme == 'brand':
-            self.colors = {
-                'background': '#121212',
-                'title': '#C5FFC8',
-                'legend_text': '#769978',
-                'grid': '#2D3130',
-                'column_one': '#C5FFC8',      # Lightest green
-                'column_two': '#90B892',      # Medium green
-                'column_three': '#5A715B',    # Dark green
-                # Multi-color style
-                'column_multi_one': '#C5FFC8',   # Green
-                'column_multi_two': '#FF4444',    # Red
-                'column_multi_three': '#B19CD9',  # Purple
-            }
-        elif self.theme == 'black':
-            self.colors = {
-                'background': '#121212',
-                'title': '#FFFFFF',
-                'legend_text': '#999999',
-                'grid': '#2D3130',
-                'column_one': '#FFFFFF',      # White
-                'column_two': '#808080',      # Medium gray
-                'column_three': '#4D4D4D',    # Dark gray
-                # Multi-color style
-                'column_multi_one': '#C5FFC8',   # Green
-                'column_multi_two': '#FF4444',    # Red
-                'column_multi_three': '#B19CD9',  # Purple
-            }
-        else:  # white theme
-            self.colors = {
-                'background': '#FFFFFF',
-                'title': '#000000',
-                'legend_text': '#666666',
-                'grid': '#E0E0E0',
-                'column_one': '#000000',      # Black
-                'column_two': '#808080',      # Medium gray
-                'column_three': '#CCCCCC',    # Light gray
-                # Multi-color style
-                'column_multi_one': '#C5FFC8',   # Green
-                'column_multi_two': '#FF4444',    # Red
-                'column_multi_three': '#B19CD9',  # Purple
-            }
+        self.colors = _THEMES.get(self.theme, _THEMES['white'])
 
     def create_chart(
         self,
@@ -95,24 +179,127 @@ class SVGColumnChart:
         Returns:
             SVG string
         """
-        # Create root SVG element
-        svg = ET.Element('svg', {
-            'width': str(self.width),
-            'height': str(self.height),
-            'xmlns': 'http://www.w3.org/2000/svg',
-            'xmlns:xlink': 'http://www.w3.org/1999/xlink',
-            'viewBox': f'0 0 {self.width} {self.height}'
-        })
+        # Markup is written straight to a string buffer; only the pattern
+        # definitions, copied from the asset files, go through ElementTree
+        svg = SVGWriter()
+
+        fills = self._fills_for(labels, series)
+        chart_start_y = self._render_header(svg, title, labels, fills)
+
+        # Chart area coordinates
+        chart_x = self.padding_x
+        chart_height = self.height - self.padding_y - chart_start_y - 40  # Reserve space for x-axis labels
+
+        # Render column chart
+        self._render_columns(
+            svg, categories, series, fills,
+            chart_x, chart_start_y,
+            self.width - 2 * self.padding_x, chart_height
+        )
+
+        svg.end('svg')
+        return svg.getvalue()
+
+    def create_many(
+        self,
+        categories: List[str],
+        series_batch: Union[Sequence[Sequence[Sequence[float]]], np.ndarray],
+        labels: List[str],
+        title: str = "Group Column Chart"
+    ) -> List[str]:
+        """Create several column charts that share categories, labels and title.
+
+        Produces the same SVG as calling create_chart once per chart, but the
+        markup that does not depend on the values is rendered once and the
+        column geometry for the whole batch is computed in one pass.
+
+        Args:
+            categories: Category labels (x-axis)
+            series_batch: Data for each chart, shaped (charts, series, values).
+                Every chart needs the same number of series
+            labels: Legend labels
+            title: Chart title
+
+        Returns:
+            List of SVG strings, one per chart
+        """
+        num_categories = len(categories)
+
+        # As in create_chart, series may be longer than the categories and
+        # differ in length; only the first num_categories points are drawn
+        values = np.asarray(
+            [[data_series[:num_categories] for data_series in chart_series] for chart_series in series_batch],
+            dtype=np.float64
+        )
+        if values.ndim != 3:
+            raise ValueError(
+                f"series_batch must be shaped (charts, series, values), got {values.ndim} dimensions"
+            )
+        num_charts, num_series, _ = values.shape
+
+        fills = self._fills_for(labels, range(num_series))
+
+        # Everything above the plot area is the same for every chart
+        header = SVGWriter()
+        chart_start_y = self._render_header(header, title, labels, fills)
+        header_markup = header.getvalue()
+
+        chart_x = self.padding_x
+        chart_width = self.width - 2 * self.padding_x
+        chart_height = self.height - self.padding_y - chart_start_y - 40  # Reserve space for x-axis labels
+
+        # So are the column positions and category labels
+        group_centers, column_xs = self._column_positions(
+            num_categories, num_series, chart_x, chart_width
+        )
+        labels_svg = SVGWriter()
+        self._render_category_labels(labels_svg, categories, group_centers, chart_start_y + chart_height + 20)
+        labels_markup = labels_svg.getvalue()
+
+        # Scale each chart by its own maximum, as create_chart does. The
+        # drawn points give it in one reduction; only charts with points
+        # past the last category need those checked as well
+        peaks = values.max(axis=(1, 2))
+        for i, chart_series in enumerate(series_batch):
+            tails = [np.ravel(data_series[num_categories:]) for data_series in chart_series
+                     if len(data_series) > num_categories]
+            if tails:
+                peaks[i] = max(peaks[i], np.concatenate(tails).max())
+        y_maxes = self._axis_tops(peaks)
+        column_heights = (values / y_maxes[:, np.newaxis, np.newaxis]) * chart_height
+        column_ys = chart_start_y + chart_height - column_heights
+
+        charts = []
+        for i in range(num_charts):
+            svg = SVGWriter()
+            svg.raw(header_markup)
+            self._render_y_ticks(svg, y_maxes[i].item(), chart_x, chart_start_y, chart_height)
+            self._render_column_rects(svg, fills, column_xs, column_ys[i], column_heights[i])
+            svg.raw(labels_markup)
+            svg.end('svg')
+            charts.append(svg.getvalue())
+        return charts
+
+    def _fills_for(self, labels: List[str], series: Sequence) -> Tuple[str, ...]:
+        """Fills for each series, looked up once for the legend and columns.
+
+        Series beyond the style's fills use column_one.
+        """
+        fills = tuple(self._get_column_fills())
+        num_fills = max(len(labels), len(series))
+        return fills + (self.colors['column_one'],) * (num_fills - len(fills))
 
-        # Add Google Fonts
-        style_elem = ET.SubElement(svg, 'style')
-        style_elem.text = """
-            @import url('https://fonts.googleapis.com/css2?family=Hubot+Sans:wght@400&display=swap');
-            text { font-family: 'Hubot Sans', sans-serif; }
+    def _render_header(self, svg, title: str, labels: List[str], fills: Tuple[str, ...]) -> int:
+        """Open the root element and render everything above the plot area.
+
+        Returns:
+            Y coordinate where chart area starts
         """
+        # Root element and font import
+        svg.raw(SVG_HEADER_TMPL.format(w=self.width, h=self.height))
 
         # Background rectangle
-        ET.SubElement(svg, 'rect', {
+        svg.element('rect', {
             'width': str(self.width),
             'height': str(self.height),
             'fill': self.colors['background'],
@@ -121,160 +308,68 @@ class SVGColumnChart:
         })
 
         # Define patterns FIRST (before rendering legend)
-        self._create_patterns(svg)
+        svg.raw(self._defs_for(self.style))
 
         # Render title and legend with patterns/colors
-        chart_start_y = self._render_title_and_legend(svg, title, labels)
-
-        # Chart area coordinates
-        chart_x = self.padding_x
-        chart_height = self.height - self.padding_y - chart_start_y - 40  # Reserve space for x-axis labels
+        return self._render_title_and_legend(svg, title, labels, fills)
 
-        # Render column chart
-        self._render_columns(
-            svg, categories, series,
-            chart_x, chart_start_y,
-            self.width - 2 * self.padding_x, chart_height
-        )
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _defs_for(cls, style: int) -> str:
+        """Return the <defs> markup with the pattern definitions a style uses.
 
-        # Convert to string
-        return ET.tostring(svg, encoding='unicode', method='xml')
-
-    def _create_patterns(self, svg):
-        """Create SVG pattern definitions based on style."""
-        defs = svg.find('defs')
-        if defs is None:
-            defs = ET.SubElement(svg, 'defs')
-
-        # Get path to assets directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_dir = os.path.join(os.path.dirname(os.path.dirname(current_dir)), 'assets')
+        The patterns depend only on the style, so each style's block is
+        built once and reused by every chart.
+        """
+        patterns = []
 
         # Style 2: noise pattern for middle column
-        if self.style == 2:
-            self._load_pattern_from_file(
-                defs,
-                'pattern-noise',
-                os.path.join(assets_dir, 'large', 'noise_rectangle_large.svg')
-            )
+        if style == 2:
+            patterns.append(_load_pattern('pattern-noise', _NOISE_PATTERN_PATH))
 
         # Style 3: crossing lines for middle column
-        elif self.style == 3:
-            self._load_pattern_from_file(
-                defs,
-                'pattern-crossing',
-                os.path.join(assets_dir, 'pattern_crossing_lines.svg')
-            )
+        elif style == 3:
+            patterns.append(_load_pattern('pattern-crossing', _CROSSING_PATTERN_PATH))
 
         # Style 4: noise + dither crosses
-        elif self.style == 4:
-            self._load_pattern_from_file(
-                defs,
-                'pattern-noise',
-                os.path.join(assets_dir, 'large', 'noise_rectangle_large.svg')
-            )
-            self._load_pattern_from_file(
-                defs,
-                'pattern-dither',
-                os.path.join(assets_dir, 'large', 'dither_cross_large.svg')
-            )
+        elif style == 4:
+            patterns.append(_load_pattern('pattern-noise', _NOISE_PATTERN_PATH))
+            patterns.append(_load_pattern('pattern-dither', _DITHER_PATTERN_PATH))
 
-    def _load_pattern_from_file(self, defs, pattern_id: str, svg_file: str):
-        """Load and embed an SVG pattern from a file."""
-        pattern_tree = ET.parse(svg_file)
-        pattern_root = pattern_tree.getroot()
-
-        # Extract width and height
-        width = pattern_root.get('width')
-        height = pattern_root.get('height')
-        viewBox = pattern_root.get('viewBox')
-
-        if viewBox:
-            viewBox_parts = viewBox.split()
-            if len(viewBox_parts) == 4:
-                width = viewBox_parts[2]
-                height = viewBox_parts[3]
-
-        # Create pattern element
-        pattern_elem = ET.SubElement(defs, 'pattern', {
-            'id': pattern_id,
-            'patternUnits': 'userSpaceOnUse',
-            'width': width,
-            'height': height
-        })
+        if patterns:
+            return f"<defs>{''.join(patterns)}</defs>"
+        return "<defs />"
 
-        # Copy all child elements from the pattern SVG
-        for child in pattern_root:
-            tag = child.tag
-            if tag.startswith('{'):
-                tag = tag.split('}')[1]
-            if tag in ['title', 'desc', 'metadata']:
-                continue
-            self._copy_element(child, pattern_elem)
-
-    def _copy_element(self, source, parent):
-        """Recursively copy an element and its children."""
-        tag = source.tag
-        if tag.startswith('{'):
-            tag = tag.split('}')[1]
-
-        attribs = {}
-        for key, value in source.attrib.items():
-            if key.startswith('{'):
-                key = key.split('}')[1]
-            attribs[key] = value
-
-        new_elem = ET.SubElement(parent, tag, attribs)
-        new_elem.text = source.text
-        new_elem.tail = source.tail
-
-        for child in source:
-            self._copy_element(child, new_elem)
-
-    def _render_title_and_legend(self, svg, title: str, labels: List[str]) -> int:
+    def _render_title_and_legend(self, svg, title: str, labels: List[str], fills: Tuple[str, ...]) -> int:
         """Render title and legend with appropriate fills."""
         # Title
-        title_elem = ET.SubElement(svg, 'text', {
+        svg.element('text', {
             'x': str(self.padding_x),
             'y': str(self.padding_y + 20),
             'fill': self.colors['title'],
             'font-size': '20',
             'font-weight': '400'
-        })
-        title_elem.text = title
+        }, title)
 
         # Legend
         legend_y = self.padding_y + 20 + self.title_gap + 4
-        legend_x = self.padding_x
-
-        # Get fills based on style
-        fills = self._get_column_fills()
-
-        for i, label in enumerate(labels):
-            fill = fills[i] if i < len(fills) else self.colors['column_one']
-
-            # Legend box
-            ET.SubElement(svg, 'rect', {
-                'x': str(legend_x),
-                'y': str(legend_y),
-                'width': '20',
-                'height': '10',
-                'fill': fill,
-                'rx': '2',
-                'ry': '2'
-            })
-
-            # Legend text
-            text = ET.SubElement(svg, 'text', {
-                'x': str(legend_x + 28),
-                'y': str(legend_y + 9),
-                'fill': self.colors['legend_text'],
-                'font-size': '14',
-                'font-weight': '400'
-            })
-            text.text = label
-
-            legend_x += 20 + 8 + len(label) * 8 + 20
+        text_y = legend_y + 9
+        text_fill = escape_attr(self.colors['legend_text'])
+
+        # Each item is box (20px) + gap (8px) + estimated text width + gap (20px)
+        legend_xs = accumulate(
+            (20 + 8 + len(label) * 8 + 20 for label in labels[:-1]),
+            initial=self.padding_x
+        )
+
+        # Box and label markup for every item, written in one go
+        svg.raw("".join(
+            f'<rect x="{legend_x}" y="{legend_y}" width="20" height="10" '
+            f'fill="{escape_attr(fill)}" rx="2" ry="2" />'
+            f'<text x="{legend_x + 28}" y="{text_y}" fill="{text_fill}" font-size="14" font-weight="400"'
+            + (f'>{escape_text(label)}</text>' if label else ' />')
+            for label, fill, legend_x in zip(labels, fills, legend_xs)
+        ))
 
         return self.padding_y + 20 + self.title_gap + 24 + self.chart_top_margin
 
@@ -321,6 +416,7 @@ class SVGColumnChart:
         svg,
         categories: List[str],
         series: List[List[float]],
+        fills: Tuple[str, ...],
         chart_x: int,
         chart_start_y: int,
         chart_width: int,
@@ -328,73 +424,117 @@ class SVGColumnChart:
     ):
         """Render grouped vertical columns."""
         num_categories = len(categories)
-        num_series = len(series)
 
-        # Calculate column dimensions
-        group_width = chart_width / num_categories
-        column_width = 40  # Fixed column width
-        column_spacing = 10  # Space between columns in a group
+        # Scale to the largest value in any series, including points past
+        # the last category
+        y_max = self._axis_tops(self._peak(series)).item()
 
-        # Calculate max value for scaling
-        max_value = max(max(s) for s in series)
+        self._render_y_ticks(svg, y_max, chart_x, chart_start_y, chart_height)
 
-        # Add some padding to max value for better visualization
-        y_max = max_value * 1.1
+        # Calculate every column's geometry at once, for the points that
+        # have a category. Series may differ in length, so each is cut to
+        # the categories before stacking: rows are series and columns are
+        # categories
+        values = np.asarray([data_series[:num_categories] for data_series in series], dtype=np.float64)
+        group_centers, column_xs = self._column_positions(
+            num_categories, len(series), chart_x, chart_width
+        )
+        column_heights = (values / y_max) * chart_height
+        column_ys = chart_start_y + chart_height - column_heights
+
+        self._render_column_rects(svg, fills, column_xs, column_ys, column_heights)
+        self._render_category_labels(svg, categories, group_centers, chart_start_y + chart_height + 20)
 
-        # Get fills
-        fills = self._get_column_fills()
+    @staticmethod
+    def _peak(series: Sequence[Sequence[float]]) -> float:
+        """Return the largest value in a chart's series, which may differ in length."""
+        return np.concatenate([np.ravel(data_series) for data_series in series]).max()
 
-        # Render y-axis labels
+    @staticmethod
+    def _axis_tops(peaks) -> np.ndarray:
+        """Return the top of the value axis for each chart's peak value."""
+        # Add some padding to max value for better visualization
+        tops = np.asarray(peaks, dtype=np.float64) * 1.1
+        # All-zero data would divide by zero, so fall back to a unit scale
+        return np.where(tops != 0, tops, 1.0)
+
+    def _render_y_ticks(self, svg, y_max: float, chart_x: int, chart_start_y: int, chart_height: int):
+        """Render y-axis labels."""
+        # Attributes shared by every tick, column or label are set once on a
+        # parent <g> rather than repeated on each element
+        svg.start('g', {
+            'fill': self.colors['legend_text'],
+            'font-size': '12',
+            'font-weight': '400',
+            'text-anchor': 'end'
+        })
         num_y_ticks = 5
         for i in range(num_y_ticks + 1):
             tick_value = int((i / num_y_ticks) * y_max)
             y = chart_start_y + chart_height - (i / num_y_ticks) * chart_height
 
-            tick_elem = ET.SubElement(svg, 'text', {
+            svg.element('text', {
                 'x': str(chart_x - 10),
-                'y': str(y + 4),
-                'fill': self.colors['legend_text'],
-                'font-size': '12',
-                'font-weight': '400',
-                'text-anchor': 'end'
-            })
-            tick_elem.text = str(tick_value)
-
-        # Render each group (category)
-        for cat_idx, category in enumerate(categories):
-            group_x = chart_x + cat_idx * group_width
-            group_center = group_x + group_width / 2
-
-            # Calculate starting x for columns (centered in group)
-            total_columns_width = num_series * column_width + (num_series - 1) * column_spacing
-            columns_start_x = group_center - total_columns_width / 2
-
-            # Render columns in this group
-            for series_idx, data_series in enumerate(series):
-                value = data_series[cat_idx]
-                column_height = (value / y_max) * chart_height
-
-                column_x = columns_start_x + series_idx * (column_width + column_spacing)
-                column_y = chart_start_y + chart_height - column_height
-
-                fill = fills[series_idx] if series_idx < len(fills) else self.colors['column_one']
-
-                # Draw column
-                ET.SubElement(svg, 'rect', {
-                    'x': str(column_x),
-                    'y': str(column_y),
-                    'width': str(column_width),
-                    'height': str(column_height),
-                    'fill': fill
-                })
-
-            # Category label
-            label_elem = ET.SubElement(svg, 'text', {
+                'y': str(y + 4)
+            }, str(tick_value))
+        svg.end('g')
+
+    @staticmethod
+    def _column_positions(
+        num_categories: int,
+        num_series: int,
+        chart_x: int,
+        chart_width: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (group_centers, column_xs) for a grid of columns.
+
+        column_xs has a row per series and a column per category, with each
+        category's columns centered within its group.
+        """
+        group_width = chart_width / num_categories
+        group_centers = chart_x + np.arange(num_categories) * group_width + group_width / 2
+        total_columns_width = num_series * _COLUMN_WIDTH + (num_series - 1) * _COLUMN_SPACING
+        column_xs = (
+            (group_centers - total_columns_width / 2)[np.newaxis, :]
+            + (np.arange(num_series) * (_COLUMN_WIDTH + _COLUMN_SPACING))[:, np.newaxis]
+        )
+        return group_centers, column_xs
+
+    @staticmethod
+    def _render_column_rects(
+        svg,
+        fills: Tuple[str, ...],
+        column_xs: np.ndarray,
+        column_ys: np.ndarray,
+        column_heights: np.ndarray
+    ):
+        """Render columns one series at a time, each in its own fill group.
+
+        The geometry is already computed, so the loop only formats markup.
+        """
+        width_str = str(_COLUMN_WIDTH)
+        for fill, xs, ys, heights in zip(
+            fills, column_xs.tolist(), column_ys.tolist(), column_heights.tolist()
+        ):
+            svg.start('g', {'fill': fill})
+            svg.raw("".join(
+                f'<rect x="{column_x}" y="{column_y}" width="{width_str}" height="{column_height}" />'
+                for column_x, column_y, column_height in zip(xs, ys, heights)
+            ))
+            svg.end('g')
+
+    def _render_category_labels(self, svg, categories: List[str], group_centers: np.ndarray, y: int):
+        """Render category labels below each group."""
+        svg.start('g', {
+            'fill': self.colors['legend_text'],
+            'font-size': '14',
+            'font-weight': '400',
+            'text-anchor': 'middle'
+        })
+        y_str = str(y)
+        for category, group_center in zip(categories, group_centers.tolist()):
+            svg.element('text', {
                 'x': str(group_center),
-                'y': str(chart_start_y + chart_height + 20),
-                'fill': self.colors['legend_text'],
-                'font-size': '14',
-                'font-weight': '400',
-                'text-anchor': 'middle'
-            })
-            label_elem.text = category
+                'y': y_str
+            }, category)
+        svg.end('g')
@@ -1,15 +1,20 @@
 """Line chart implementation with Wisent brand styling."""
 
-from typing import Optional, Union, List, Tuple
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List, Tuple
 import numpy as np
 
 from wisent_plots.styles.style_config import get_style
+from wisent_plots.charts._util import resolve_style
+from wisent_plots.charts.svg_cache import cache_svg
+from wisent_plots.charts.svg_io import write_svg
 from wisent_plots.charts.line.svg_line_chart import SVGLineChart
 
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
+
 class LineChart:
     """Create line charts with Wisent brand styling.
 
@@ -51,6 +56,54 @@ class LineChart:
         Raises:
             ValueError: If style is not between 1 and 6.
         """
+        self.style_number, self.style_config = self._resolve_style_config(style)
+        self._flatten_style()
+
+        self.figsize = figsize
+        self.dpi = dpi
+        self.line_width = line_width
+        # Styles 2, 3, 5, 6 have markers (second and third in each theme)
+        self._show_markers = show_markers
+        self.show_markers = show_markers if self.style_number not in [1, 4] else False
+
+    def set_style(self, style: Union[int, str]) -> None:
+        """Switch the chart to a different style without rebuilding it.
+
+        Args:
+            style: Style number (1-6) for line charts.
+
+        Raises:
+            ValueError: If style is not between 1 and 6.
+        """
+        self.style_number, self.style_config = self._resolve_style_config(style)
+        self._flatten_style()
+        self.show_markers = self._show_markers if self.style_number not in [1, 4] else False
+
+    def _flatten_style(self) -> None:
+        """Copy the nested style_config values used while plotting onto attributes.
+
+        Saves walking several dict levels for every value on each plot call.
+        """
+        colors = self.style_config["colors"]
+        font = self.style_config["font"]
+
+        self._bg_color = colors["background"]
+        self._text_color = colors["text"]
+        self._legend_color = colors.get("legend_text", colors["text"])
+        self._tick_color = colors["legend_text"]
+        self._grid_color = colors["grid"]
+        self._palette = (colors["primary"], colors["secondary"], colors["accent"])
+
+        self._font_family = font["family"]
+        self._title_fs = font["size"]["title"]
+        self._title_fw = font["weight"]["title"]
+        self._label_fs = font["size"]["label"]
+        self._label_fw = font["weight"]["label"]
+        self._tick_fs = font["size"]["tick"]
+
+    @classmethod
+    def _resolve_style_config(cls, style: Union[int, str]) -> Tuple[int, Dict[str, Any]]:
+        """Resolve a style number or name to (style_number, style_config)."""
         # Map style names to numbers
         style_map = {
             "solid": 1,
@@ -58,30 +111,22 @@ class LineChart:
             "shapes": 3,
         }
 
-        # Convert style name to number if needed
-        if isinstance(style, str):
-            style_lower = style.lower()
-            if style_lower in style_map:
-                self.style_number = style_map[style_lower]
-            else:
-                raise ValueError(f"Unknown style name: {style}. Valid names are: {', '.join(style_map.keys())}")
-        else:
-            self.style_number = style
+        style_number = resolve_style(style, style_map)
 
         # Map line chart styles to actual style numbers
         # Dark theme: Style 1 -> 10, Style 2 -> 11, Style 3 -> 12
         # White theme: Style 4 -> 20, Style 5 -> 21, Style 6 -> 22
-        if self.style_number <= 3:
-            actual_style = 9 + self.style_number
+        if style_number <= 3:
+            actual_style = 9 + style_number
         else:
-            actual_style = 16 + self.style_number
+            actual_style = 16 + style_number
 
         # For line charts, use line chart specific styles
         try:
-            self.style_config = get_style(actual_style)
+            style_config = get_style(actual_style)
         except ValueError:
             # Fallback if style doesn't exist
-            self.style_config = {
+            style_config = {
                 "colors": {
                     "primary": "#C5FFC8",
                     "secondary": "#FA5A46",
@@ -98,11 +143,7 @@ class LineChart:
                 },
             }
 
-        self.figsize = figsize
-        self.dpi = dpi
-        self.line_width = line_width
-        # Styles 2, 3, 5, 6 have markers (second and third in each theme)
-        self.show_markers = show_markers if self.style_number not in [1, 4] else False
+        return style_number, style_config
 
     def plot(
         self,
@@ -113,9 +154,9 @@ class LineChart:
         ylabel: Optional[str] = None,
         color: Optional[str] = None,
         label: Optional[str] = None,
-        fig: Optional[Figure] = None,
-        ax: Optional[Axes] = None,
-    ) -> Tuple[Figure, Axes]:
+        fig: Optional["Figure"] = None,
+        ax: Optional["Axes"] = None,
+    ) -> Tuple["Figure", "Axes"]:
         """Create a line chart.
 
         Args:
@@ -132,19 +173,21 @@ class LineChart:
         Returns:
             Tuple of (figure, axes) objects.
         """
-        # Convert to numpy arrays
+        # Convert to numpy arrays (arrays pass through without a copy)
         x = np.asarray(x)
         y = np.asarray(y)
 
         # Create figure and axes if not provided
         if fig is None or ax is None:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
 
         # Apply style configuration
         self._apply_style(fig, ax)
 
         # Determine color
-        line_color = color if color else self.style_config["colors"]["primary"]
+        line_color = color if color else self._palette[0]
 
         # Plot line
         line = ax.plot(
@@ -161,46 +204,46 @@ class LineChart:
         if title:
             ax.set_title(
                 title,
-                fontsize=self.style_config["font"]["size"]["title"],
-                fontweight=self.style_config["font"]["weight"]["title"],
+                fontsize=self._title_fs,
+                fontweight=self._title_fw,
                 pad=10,
-                color=self.style_config["colors"]["text"],
+                color=self._text_color,
                 loc='left',
             )
 
         if xlabel:
             ax.set_xlabel(
                 xlabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
                 labelpad=10,
-                color=self.style_config["colors"]["text"],
+                color=self._text_color,
             )
 
         if ylabel:
             ax.set_ylabel(
                 ylabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
                 labelpad=10,
-                color=self.style_config["colors"]["text"],
+                color=self._text_color,
             )
 
         # Add legend if label provided
         if label:
             legend = ax.legend(
-                fontsize=self.style_config["font"]["size"]["tick"],
+                fontsize=self._tick_fs,
                 frameon=False,
             )
-            legend_color = self.style_config["colors"].get("legend_text", self.style_config["colors"]["text"])
             for text in legend.get_texts():
-                text.set_color(legend_color)
+                text.set_color(self._legend_color)
 
         # Tight layout
         fig.tight_layout()
 
         return fig, ax
 
+    @cache_svg
     def plot_multiple(
         self,
         x: Union[List, np.ndarray],
@@ -210,10 +253,10 @@ class LineChart:
         title: Optional[str] = None,
         xlabel: Optional[str] = None,
         ylabel: Optional[str] = None,
-        fig: Optional[Figure] = None,
-        ax: Optional[Axes] = None,
+        fig: Optional["Figure"] = None,
+        ax: Optional["Axes"] = None,
         output_format: str = 'svg',
-    ) -> Union[Tuple[Figure, Axes], str]:
+    ) -> Union[Tuple["Figure", "Axes"], str]:
         """Create a line chart with multiple data series.
 
         Args:
@@ -273,6 +316,8 @@ class LineChart:
 
         # Matplotlib fallback
         if fig is None or ax is None:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
 
         # Apply style configuration
@@ -281,16 +326,9 @@ class LineChart:
         # Convert x to numpy array
         x = np.asarray(x)
 
-        # Determine colors
+        # Determine colors; series beyond the palette cycle through it
         if colors is None:
-            colors = [
-                self.style_config["colors"]["primary"],
-                self.style_config["colors"]["secondary"],
-                self.style_config["colors"]["accent"],
-            ]
-            # Extend colors if needed
-            while len(colors) < len(y_series):
-                colors.extend(colors)
+            colors = self._palette
 
         # Convert all y_series to numpy arrays and plot
         for i, y in enumerate(y_series):
@@ -312,51 +350,50 @@ class LineChart:
         if title:
             ax.set_title(
                 title,
-                fontsize=self.style_config["font"]["size"]["title"],
-                fontweight=self.style_config["font"]["weight"]["title"],
+                fontsize=self._title_fs,
+                fontweight=self._title_fw,
                 pad=10,
-                color=self.style_config["colors"]["text"],
+                color=self._text_color,
                 loc='left',
             )
 
         if xlabel:
             ax.set_xlabel(
                 xlabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
                 labelpad=10,
-                color=self.style_config["colors"]["text"],
+                color=self._text_color,
             )
 
         if ylabel:
             ax.set_ylabel(
                 ylabel,
-                fontsize=self.style_config["font"]["size"]["label"],
-                fontweight=self.style_config["font"]["weight"]["label"],
+                fontsize=self._label_fs,
+                fontweight=self._label_fw,
                 labelpad=10,
-                color=self.style_config["colors"]["text"],
+                color=self._text_color,
             )
 
         # Add legend if labels provided
         if labels:
             legend = ax.legend(
-                fontsize=self.style_config["font"]["size"]["tick"],
+                fontsize=self._tick_fs,
                 frameon=False,
             )
-            legend_color = self.style_config["colors"].get("legend_text", self.style_config["colors"]["text"])
             for text in legend.get_texts():
-                text.set_color(legend_color)
+                text.set_color(self._legend_color)
 
         # Tight layout
         fig.tight_layout()
 
         return fig, ax
 
-    def _apply_style(self, fig: Figure, ax: Axes) -> None:
+    def _apply_style(self, fig: "Figure", ax: "Axes") -> None:
         """Apply style configuration to figure and axes."""
         # Set background colors
-        fig.patch.set_facecolor(self.style_config["colors"]["background"])
-        ax.set_facecolor(self.style_config["colors"]["background"])
+        fig.patch.set_facecolor(self._bg_color)
+        ax.set_facecolor(self._bg_color)
 
         # Configure grid
         ax.grid(
@@ -364,7 +401,7 @@ class LineChart:
             alpha=0.3,
             linestyle='-',
             linewidth=1.0,
-            color=self.style_config["colors"]["grid"],
+            color=self._grid_color,
             zorder=0,
         )
 
@@ -375,18 +412,20 @@ class LineChart:
         # Configure tick parameters
         ax.tick_params(
             axis="both",
-            labelsize=self.style_config["font"]["size"]["tick"],
-            colors=self.style_config["colors"]["legend_text"],
+            labelsize=self._tick_fs,
+            colors=self._tick_color,
             length=0,
             pad=10,
         )
 
         # Set font family
-        plt.rcParams["font.family"] = self.style_config["font"]["family"]
+        import matplotlib.pyplot as plt
+
+        plt.rcParams["font.family"] = self._font_family
 
     def save(
         self,
-        fig: Figure,
+        fig: "Figure",
         filename: str,
         dpi: Optional[int] = None,
         transparent: bool = False,
@@ -406,3 +445,12 @@ class LineChart:
             bbox_inches="tight",
             transparent=transparent,
         )
+
+    def save_svg(self, svg_string: str, filename: str):
+        """Save SVG string to file.
+
+        Args:
+            svg_string: SVG content as string
+            filename: Output filename
+        """
+        write_svg(svg_string, filename)
@@ -1,9 +1,12 @@
 """SVG-based line chart for pixel-perfect Figma matching."""
 
-from typing import List
-import xml.etree.ElementTree as ET
+from typing import List, Sequence, Union
 
-from wisent_plots.charts.area.area_chart_components import render_title_and_legend
+import numpy as np
+
+from wisent_plots.charts.area.area_chart_components import render_title_and_legend_markup
+from wisent_plots.charts.svg_io import write_svg
+from wisent_plots.charts.svg_markup import SVG_HEADER_TMPL, SVGWriter, escape_attr, format_number
 
 
 class SVGLineChart:
@@ -47,8 +50,8 @@ class SVGLineChart:
 
     def create_chart(
         self,
-        x_data: List[float],
-        y_series: List[List[float]],
+        x_data: Union[List[float], np.ndarray],
+        y_series: Sequence[Union[List[float], np.ndarray]],
         labels: List[str],
         title: str = "Line Chart",
         line_width: float = 2.0,
@@ -58,8 +61,8 @@ class SVGLineChart:
         """Create SVG line chart matching Figma design exactly.
 
         Args:
-            x_data: X-axis data points
-            y_series: List of Y-axis data series
+            x_data: X-axis data points (list or numpy array)
+            y_series: List of Y-axis data series (lists or numpy arrays)
             labels: Labels for each series
             title: Chart title
             line_width: Width of lines
@@ -69,37 +72,28 @@ class SVGLineChart:
         Returns:
             SVG string
         """
-        # Create SVG root with exact Figma dimensions
-        svg = ET.Element('svg', {
-            'width': str(self.width),
-            'height': str(self.height),
-            'xmlns': 'http://www.w3.org/2000/svg',
-            'viewBox': f'0 0 {self.width} {self.height}'
-        })
+        # Markup is written straight to a string buffer; no element tree
+        svg = SVGWriter()
 
-        # Add Hubot Sans font definition
-        style = ET.SubElement(svg, 'style')
-        style.text = """
-            @import url('https://fonts.googleapis.com/css2?family=Hubot+Sans:wght@400&display=swap');
-            text { font-family: 'Hubot Sans', sans-serif; }
-        """
+        # Root element with exact Figma dimensions, and font
+        svg.raw(SVG_HEADER_TMPL.format(w=self.width, h=self.height))
 
         # Background with rounded corners (20px radius from Figma)
         # Use background color from colors dict
-        bg_color = self.colors.get('background', '#121212')
-        bg = ET.SubElement(svg, 'rect', {
+        svg.element('rect', {
             'width': str(self.width),
             'height': str(self.height),
-            'fill': bg_color,
+            'fill': self.colors.get('background', '#121212'),
             'rx': '20',
             'ry': '20'
         })
 
         # Render title and legend
-        chart_start_y = render_title_and_legend(
-            svg, title, labels, self.colors,
+        title_markup, chart_start_y = render_title_and_legend_markup(
+            title, labels, self.colors,
             self.padding_x, self.padding_y, self.title_gap, self.chart_top_margin
         )
+        svg.raw(title_markup)
         chart_x = self.padding_x
 
         # Render grid and lines
@@ -109,8 +103,8 @@ class SVGLineChart:
             line_width, show_markers, marker_shapes
         )
 
-        # Convert to string
-        return ET.tostring(svg, encoding='unicode', method='xml')
+        svg.end('svg')
+        return svg.getvalue()
 
     def _render_grid(self, svg, chart_x: int, chart_y: int):
         """Render grid lines and axis labels."""
@@ -122,7 +116,7 @@ class SVGLineChart:
             x = chart_x + (i * grid_spacing)
             if x <= chart_x + self.chart_width:
                 # Vertical dashed line
-                ET.SubElement(svg, 'line', {
+                svg.element('line', {
                     'x1': str(x),
                     'y1': str(chart_y),
                     'x2': str(x),
@@ -134,16 +128,14 @@ class SVGLineChart:
 
                 # X-axis label below chart
                 if i < num_lines:
-                    label_text = f"{i+1:02d}"
-                    label_elem = ET.SubElement(svg, 'text', {
+                    svg.element('text', {
                         'x': str(x),
                         'y': str(chart_y + 453),
                         'fill': self.colors['legend_text'],
                         'font-size': '14',
                         'font-weight': '400',
                         'text-anchor': 'start'
-                    })
-                    label_elem.text = label_text
+                    }, f"{i+1:02d}")
 
         # Horizontal grid lines (every ~110px based on Figma)
         horizontal_spacing = 110
@@ -153,7 +145,7 @@ class SVGLineChart:
             y = chart_y + (i * horizontal_spacing)
             if y <= chart_y + 440:
                 # Horizontal line
-                ET.SubElement(svg, 'line', {
+                svg.element('line', {
                     'x1': str(chart_x),
                     'y1': str(y),
                     'x2': str(chart_x + self.chart_width),
@@ -165,8 +157,8 @@ class SVGLineChart:
     def _render_lines(
         self,
         svg,
-        x_data: List[float],
-        y_series: List[List[float]],
+        x_data: Union[List[float], np.ndarray],
+        y_series: Sequence[Union[List[float], np.ndarray]],
         chart_x: int,
         chart_y: int,
         line_width: float,
@@ -174,18 +166,17 @@ class SVGLineChart:
         marker_shapes: List[str]
     ):
         """Render line series with optional markers."""
-        import numpy as np
-
         # Calculate chart dimensions
         chart_width = self.chart_width
         chart_height = 430  # Actual chart area height
 
+        # Convert each series once; the arrays are reused for the pixel mapping
+        series_arrays = [np.asarray(series, dtype=np.float64) for series in y_series]
+
         # Find min and max values across all series
-        all_values = []
-        for series in y_series:
-            all_values.extend(series)
-        min_val = min(all_values)
-        max_val = max(all_values)
+        all_values = np.concatenate(series_arrays)
+        min_val = all_values.min().item()
+        max_val = all_values.max().item()
         value_range = max_val - min_val if max_val != min_val else 1
 
         # Line colors - build from available color keys
@@ -204,30 +195,32 @@ class SVGLineChart:
         if marker_shapes is None:
             marker_shapes = ['circle', 'square', 'diamond']
 
+        # X positions are shared by every series, so compute and format
+        # them once
+        num_points = len(x_data)
+        x_positions = (
+            chart_x + np.arange(num_points) * (chart_width / (num_points - 1))
+        ).tolist()
+        x_labels = [format_number(x_pos) for x_pos in x_positions]
+
         # Render each line series
-        for series_idx, series_data in enumerate(y_series):
+        for series_idx, values in enumerate(series_arrays):
             color = line_colors[series_idx % len(line_colors)]
             marker_shape = marker_shapes[series_idx % len(marker_shapes)]
 
-            # Build path data
-            path_d = ""
-            points = []
+            # Map the whole series to pixels at once, inverting the Y axis
+            # (higher values at top)
+            y_positions = (
+                chart_y + chart_height - ((values[:num_points] - min_val) / value_range * chart_height)
+            ).tolist()
 
-            for i, (x_val, y_val) in enumerate(zip(x_data, series_data)):
-                # Calculate position
-                x_pos = chart_x + (i * (chart_width / (len(x_data) - 1)))
-                # Invert Y axis (higher values at top)
-                y_pos = chart_y + chart_height - ((y_val - min_val) / value_range * chart_height)
-
-                points.append((x_pos, y_pos))
-
-                if i == 0:
-                    path_d = f"M {x_pos},{y_pos}"
-                else:
-                    path_d += f" L {x_pos},{y_pos}"
+            # Build path data in a single join rather than growing a string
+            path_d = "M " + " L ".join(
+                f"{x_label},{format_number(y_pos)}" for x_label, y_pos in zip(x_labels, y_positions)
+            ) if y_positions else ""
 
             # Draw line path
-            ET.SubElement(svg, 'path', {
+            svg.element('path', {
                 'd': path_d,
                 'stroke': color,
                 'stroke-width': str(line_width),
@@ -238,48 +231,40 @@ class SVGLineChart:
 
             # Draw markers if requested
             if show_markers:
-                for x_pos, y_pos in points:
-                    self._draw_marker(svg, x_pos, y_pos, marker_shape, color)
+                color_attr = escape_attr(color)
+                svg.raw("".join(
+                    self._marker_markup(x_pos, y_pos, marker_shape, color_attr)
+                    for x_pos, y_pos in zip(x_positions, y_positions)
+                ))
 
-    def _draw_marker(self, svg, x: float, y: float, shape: str, color: str, size: float = 11):
-        """Draw a marker at the specified position."""
+    @staticmethod
+    def _marker_markup(x: float, y: float, shape: str, color: str, size: float = 11) -> str:
+        """Return the markup for a marker at the specified position.
+
+        color must already be escaped for use in an attribute.
+        """
         half_size = size / 2
 
         if shape == 'circle':
-            ET.SubElement(svg, 'circle', {
-                'cx': str(x),
-                'cy': str(y),
-                'r': str(half_size),
-                'fill': color
-            })
+            return f'<circle cx="{format_number(x)}" cy="{format_number(y)}" r="{half_size}" fill="{color}" />'
         elif shape == 'square':
-            ET.SubElement(svg, 'rect', {
-                'x': str(x - half_size),
-                'y': str(y - half_size),
-                'width': str(size),
-                'height': str(size),
-                'fill': color,
-                'rx': '2',
-                'ry': '2'
-            })
+            return (
+                f'<rect x="{format_number(x - half_size)}" y="{format_number(y - half_size)}" '
+                f'width="{size}" height="{size}" fill="{color}" rx="2" ry="2" />'
+            )
         elif shape == 'diamond':
             # Rotate square by 45 degrees
-            points = f"{x},{y - half_size} {x + half_size},{y} {x},{y + half_size} {x - half_size},{y}"
-            ET.SubElement(svg, 'polygon', {
-                'points': points,
-                'fill': color
-            })
+            left, cx, right = format_number(x - half_size), format_number(x), format_number(x + half_size)
+            top, cy, bottom = format_number(y - half_size), format_number(y), format_number(y + half_size)
+            return f'<polygon points="{cx},{top} {right},{cy} {cx},{bottom} {left},{cy}" fill="{color}" />'
         elif shape == 'triangle':
             # Equilateral triangle pointing up
             h = half_size * 1.732  # sqrt(3) for equilateral
-            points = f"{x},{y - h * 0.67} {x + half_size},{y + h * 0.33} {x - half_size},{y + h * 0.33}"
-            ET.SubElement(svg, 'polygon', {
-                'points': points,
-                'fill': color
-            })
+            left, cx, right = format_number(x - half_size), format_number(x), format_number(x + half_size)
+            top, bottom = format_number(y - h * 0.67), format_number(y + h * 0.33)
+            return f'<polygon points="{cx},{top} {right},{bottom} {left},{bottom}" fill="{color}" />'
+        return ""
 
     def save_svg(self, svg_string: str, filename: str):
         """Save SVG to file."""
-        with open(filename, 'w') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
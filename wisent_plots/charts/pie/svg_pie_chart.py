@@ -1,8 +1,21 @@
 """SVG Pie Chart renderer matching Figma design exactly."""
 
-import math
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+import functools
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from wisent_plots.charts.svg_markup import SVG_HEADER_TMPL, SVGWriter, format_number
+
+
+@functools.lru_cache(maxsize=4096)
+def _approx_text_width(text: str, font_size: int) -> int:
+    """Estimate the rendered width of text in pixels.
+
+    Uses an average glyph width of 0.6em, so 6px per character at 10px.
+    Cached by (text, font size) since legends repeat across renders.
+    """
+    return len(text) * font_size * 3 // 5
 
 
 class SVGPieChart:
@@ -59,23 +72,14 @@ class SVGPieChart:
         Returns:
             SVG string
         """
-        # Create SVG root
-        svg = ET.Element('svg', {
-            'width': str(self.width),
-            'height': str(self.height),
-            'xmlns': 'http://www.w3.org/2000/svg',
-            'viewBox': f'0 0 {self.width} {self.height}'
-        })
+        # Markup is written straight to a string buffer; no element tree
+        svg = SVGWriter()
 
-        # Add Hubot Sans font
-        style = ET.SubElement(svg, 'style')
-        style.text = """
-            @import url('https://fonts.googleapis.com/css2?family=Hubot+Sans:wght@400&display=swap');
-            text { font-family: 'Hubot Sans', sans-serif; }
-        """
+        # Root element and font
+        svg.raw(SVG_HEADER_TMPL.format(w=self.width, h=self.height))
 
         # Background with rounded corners
-        ET.SubElement(svg, 'rect', {
+        svg.element('rect', {
             'width': str(self.width),
             'height': str(self.height),
             'fill': self.colors['background'],
@@ -99,19 +103,18 @@ class SVGPieChart:
         # Render center text
         self._render_center_text(svg, center_label, center_value, chart_center_x, chart_center_y)
 
-        # Convert to string
-        return ET.tostring(svg, encoding='unicode', method='xml')
+        svg.end('svg')
+        return svg.getvalue()
 
     def _render_title(self, svg, title: str):
         """Render chart title."""
-        title_elem = ET.SubElement(svg, 'text', {
+        svg.element('text', {
             'x': str(self.padding),
             'y': str(self.padding + 16),
             'fill': self.colors['title'],
             'font-size': '16',
             'font-weight': '400'
-        })
-        title_elem.text = title
+        }, title)
 
     def _render_legend(self, svg, labels: List[str], values: List[float]):
         """Render horizontal legend below title."""
@@ -128,7 +131,7 @@ class SVGPieChart:
             color_key = f'slice{i+1}'
             color = self.colors.get(color_key, self.colors['slice1'])
 
-            ET.SubElement(svg, 'rect', {
+            svg.element('rect', {
                 'x': str(legend_x),
                 'y': str(legend_y),
                 'width': '8',
@@ -139,23 +142,22 @@ class SVGPieChart:
             })
 
             # Label text
-            text_elem = ET.SubElement(svg, 'text', {
+            svg.element('text', {
                 'x': str(legend_x + 12),
                 'y': str(legend_y + 7),
                 'fill': self.colors['legend_text'],
                 'font-size': '10',
                 'font-weight': '400'
-            })
-            text_elem.text = label
+            }, label)
 
             # Move to next legend item
-            legend_x += 8 + 4 + len(label) * 6 + 8
+            legend_x += 8 + 4 + _approx_text_width(label, 10) + 8
 
     def _render_pie(self, svg, values: List[float], cx: float, cy: float):
         """Render pie chart slices.
 
         Args:
-            svg: SVG element to add slices to
+            svg: SVGWriter to add slices to
             values: List of values for each slice
             cx: Center X coordinate
             cy: Center Y coordinate
@@ -172,77 +174,77 @@ class SVGPieChart:
         outer_radius = max_diameter / 2
         inner_radius = outer_radius * self.inner_radius_ratio
 
-        # Draw slices
-        start_angle = -90  # Start at top (12 o'clock position)
+        # Slice boundary angles, starting at the top (12 o'clock position).
+        # Slices with no positive value are skipped and take up no angle
+        value_array = np.asarray(values, dtype=np.float64)
+        sweep_angles = np.where(value_array > 0, (value_array / total) * 360, 0.0)
+        boundary_rads = np.radians(np.cumsum(np.concatenate(([-90.0], sweep_angles))))
+
+        # Every slice's arc endpoints, from one cos/sin over all boundaries
+        cos_a = np.cos(boundary_rads)
+        sin_a = np.sin(boundary_rads)
+        outer_xs = (cx + outer_radius * cos_a).tolist()
+        outer_ys = (cy + outer_radius * sin_a).tolist()
+        inner_xs = (cx + inner_radius * cos_a).tolist()
+        inner_ys = (cy + inner_radius * sin_a).tolist()
 
-        for i, value in enumerate(values):
+        # Draw slices
+        for i, (value, sweep_angle) in enumerate(zip(values, sweep_angles.tolist())):
             if value <= 0:
                 continue
 
-            # Calculate sweep angle
-            sweep_angle = (value / total) * 360
-
             # Get color for this slice
             color_key = f'slice{i+1}'
             color = self.colors.get(color_key, self.colors['slice1'])
 
             # Draw slice
             self._draw_donut_slice(
-                svg, cx, cy,
+                svg,
+                (outer_xs[i], outer_ys[i]), (outer_xs[i + 1], outer_ys[i + 1]),
+                (inner_xs[i], inner_ys[i]), (inner_xs[i + 1], inner_ys[i + 1]),
                 outer_radius, inner_radius,
-                start_angle, sweep_angle,
+                sweep_angle > 180,
                 color
             )
 
-            start_angle += sweep_angle
-
     def _draw_donut_slice(
-        self, svg, cx: float, cy: float,
+        self, svg,
+        outer_start: Tuple[float, float], outer_end: Tuple[float, float],
+        inner_start: Tuple[float, float], inner_end: Tuple[float, float],
         outer_r: float, inner_r: float,
-        start_angle: float, sweep_angle: float,
+        large_arc: bool,
         color: str
     ):
         """Draw a donut slice using SVG path.
 
         Args:
-            svg: SVG element
-            cx, cy: Center coordinates
+            svg: SVGWriter
+            outer_start, outer_end: Outer arc endpoints
+            inner_start, inner_end: Inner arc endpoints
             outer_r: Outer radius
             inner_r: Inner radius
-            start_angle: Starting angle in degrees
-            sweep_angle: Sweep angle in degrees
+            large_arc: Whether the slice sweeps more than 180 degrees
             color: Fill color
         """
-        # Convert angles to radians
-        start_rad = math.radians(start_angle)
-        end_rad = math.radians(start_angle + sweep_angle)
-
-        # Calculate outer arc points
-        outer_x1 = cx + outer_r * math.cos(start_rad)
-        outer_y1 = cy + outer_r * math.sin(start_rad)
-        outer_x2 = cx + outer_r * math.cos(end_rad)
-        outer_y2 = cy + outer_r * math.sin(end_rad)
-
-        # Calculate inner arc points
-        inner_x1 = cx + inner_r * math.cos(start_rad)
-        inner_y1 = cy + inner_r * math.sin(start_rad)
-        inner_x2 = cx + inner_r * math.cos(end_rad)
-        inner_y2 = cy + inner_r * math.sin(end_rad)
-
-        # Determine if we need large arc flag
-        large_arc = 1 if sweep_angle > 180 else 0
+        outer_x1, outer_y1 = outer_start
+        outer_x2, outer_y2 = outer_end
+        inner_x1, inner_y1 = inner_start
+        inner_x2, inner_y2 = inner_end
+        large_arc_flag = 1 if large_arc else 0
 
         # Create path for donut slice
-        path_data = f"""
-            M {outer_x1},{outer_y1}
-            A {outer_r},{outer_r} 0 {large_arc} 1 {outer_x2},{outer_y2}
-            L {inner_x2},{inner_y2}
-            A {inner_r},{inner_r} 0 {large_arc} 0 {inner_x1},{inner_y1}
-            Z
-        """.strip()
+        outer = format_number(outer_r)
+        inner = format_number(inner_r)
+        path_data = (
+            f"M {format_number(outer_x1)},{format_number(outer_y1)} "
+            f"A {outer},{outer} 0 {large_arc_flag} 1 {format_number(outer_x2)},{format_number(outer_y2)} "
+            f"L {format_number(inner_x2)},{format_number(inner_y2)} "
+            f"A {inner},{inner} 0 {large_arc_flag} 0 {format_number(inner_x1)},{format_number(inner_y1)} "
+            "Z"
+        )
 
         # Add slice path
-        ET.SubElement(svg, 'path', {
+        svg.element('path', {
             'd': path_data,
             'fill': color,
             'stroke': self.colors['separator'],
@@ -253,29 +255,27 @@ class SVGPieChart:
         """Render text in center of donut chart.
 
         Args:
-            svg: SVG element
+            svg: SVGWriter
             label: Label text (e.g., "Total")
             value: Value text (e.g., "99999")
             cx, cy: Center coordinates
         """
         # Render label above value
-        label_elem = ET.SubElement(svg, 'text', {
+        svg.element('text', {
             'x': str(cx),
             'y': str(cy - 8),
             'fill': self.colors['center_text'],
             'font-size': '12',
             'font-weight': '400',
             'text-anchor': 'middle'
-        })
-        label_elem.text = label
+        }, label)
 
         # Render value below label
-        value_elem = ET.SubElement(svg, 'text', {
+        svg.element('text', {
             'x': str(cx),
             'y': str(cy + 8),
             'fill': self.colors['center_text'],
             'font-size': '16',
             'font-weight': '400',
             'text-anchor': 'middle'
-        })
-        value_elem.text = value
+        }, value)
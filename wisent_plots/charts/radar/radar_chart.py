@@ -1,9 +1,10 @@
 """Radar Chart implementation with matplotlib fallback and SVG output."""
 
-from typing import List, Optional
-import os
+from typing import Any, Dict, List, Optional
 
 from wisent_plots.styles.style_config import get_style
+from wisent_plots.charts.svg_cache import cache_svg
+from wisent_plots.charts.svg_io import write_svg
 from .svg_radar_chart import SVGRadarChart
 
 
@@ -22,10 +23,25 @@ class RadarChart:
         self.width = width
         self.height = height
 
+        self.style_config = self._resolve_style_config(self.style_number)
+
+    def set_style(self, style: int) -> None:
+        """Switch the chart to a different style without rebuilding it.
+
+        Args:
+            style: Style number (1=brand colors, 2=black/grayscale, 3=white)
+        """
+        self.style_number = style
+        self.style_config = self._resolve_style_config(self.style_number)
+
+    @classmethod
+    def _resolve_style_config(cls, style: int) -> Dict[str, Any]:
+        """Resolve a radar chart style number to its style configuration."""
         # Map radar chart styles: 1->50, 2->51, 3->52
-        actual_style = 49 + self.style_number
-        self.style_config = get_style(actual_style)
+        actual_style = 49 + style
+        return get_style(actual_style)
 
+    @cache_svg
     def plot(
         self,
         data_series: List[List[float]],
@@ -102,14 +118,7 @@ class RadarChart:
             svg_string: SVG content as string
             filename: Output filename
         """
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
-
         # Write SVG to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            # Add XML declaration
-            if not svg_string.startswith('<?xml'):
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(svg_string)
+        write_svg(svg_string, filename)
 
         print(f"Chart saved to {filename}")
@@ -0,0 +1,152 @@
+"""Memoization of rendered SVG strings.
+
+Chart rendering is deterministic, so an SVG produced for a given chart
+configuration and set of inputs can be reused instead of regenerated.
+Results are kept in a small in-process LRU cache. Setting the
+``WISENT_SVG_CACHE_DIR`` environment variable additionally persists them
+to that directory so repeated script invocations (e.g. CI runs that
+regenerate the example charts) can share them.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Callable, Optional
+
+# Maximum number of SVG strings kept in memory
+_MAX_ENTRIES = 128
+
+# Environment variable naming an optional on-disk cache directory
+CACHE_DIR_ENV = "WISENT_SVG_CACHE_DIR"
+
+_memory_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _input_digest(chart, method_name: str, args: tuple, kwargs: dict) -> Optional[str]:
+    """Hash a chart's public configuration and call arguments.
+
+    Private (underscore-prefixed) attributes are derived state and are
+    left out of the key. Returns None if the inputs cannot be pickled
+    (e.g. matplotlib figures), in which case the call is not cached.
+    """
+    from wisent_plots import __version__
+
+    config = {k: v for k, v in vars(chart).items() if not k.startswith('_')}
+    payload = (
+        __version__,
+        type(chart).__qualname__,
+        method_name,
+        config,
+        args,
+        sorted(kwargs.items()),
+    )
+    try:
+        data = pickle.dumps(payload, protocol=5)
+    except Exception:
+        return None
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _disk_path(digest: str) -> Optional[str]:
+    """Return the on-disk cache path for a digest, if disk caching is enabled."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, f"{digest}.svg")
+
+
+def _lookup(digest: str) -> Optional[str]:
+    """Look a digest up in memory, then on disk."""
+    if digest in _memory_cache:
+        _memory_cache.move_to_end(digest)
+        return _memory_cache[digest]
+
+    path = _disk_path(digest)
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            svg_string = f.read()
+        _remember(digest, svg_string)
+        return svg_string
+
+    return None
+
+
+def _remember(digest: str, svg_string: str) -> None:
+    """Store an SVG string in the in-memory LRU cache."""
+    _memory_cache[digest] = svg_string
+    _memory_cache.move_to_end(digest)
+    if len(_memory_cache) > _MAX_ENTRIES:
+        _memory_cache.popitem(last=False)
+
+
+def _store(digest: str, svg_string: str) -> None:
+    """Store an SVG string in memory and, if enabled, on disk."""
+    _remember(digest, svg_string)
+
+    path = _disk_path(digest)
+    if path:
+        # Write to a temporary file and move it into place, so processes
+        # sharing the directory never read a partly written SVG
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(svg_string)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def cache_svg(method: Optional[Callable] = None, *, when: Optional[Callable] = None) -> Callable:
+    """Decorate a chart plotting method so its SVG output is memoized.
+
+    Use as ``@cache_svg``, or as ``@cache_svg(when=predicate)`` when the
+    chart only renders SVG in some configurations; ``predicate(chart)``
+    then says whether it does. Calls that cannot return an SVG string
+    (``output_format`` other than ``'svg'``, a passed ``fig`` or ``ax``,
+    or a false ``when``) go straight to the wrapped method without hashing
+    their inputs. Only string results are cached, and calls whose inputs
+    cannot be hashed are never cached.
+    """
+    if method is None:
+        return functools.partial(cache_svg, when=when)
+
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        renders_svg = (
+            arguments.get('output_format', 'svg') == 'svg'
+            and arguments.get('fig') is None
+            and arguments.get('ax') is None
+            and (when is None or when(self))
+        )
+        if not renders_svg:
+            return method(self, *args, **kwargs)
+
+        digest = _input_digest(self, method.__name__, args, kwargs)
+        if digest is None:
+            return method(self, *args, **kwargs)
+
+        cached = _lookup(digest)
+        if cached is not None:
+            return cached
+
+        result = method(self, *args, **kwargs)
+        if isinstance(result, str):
+            _store(digest, result)
+        return result
+
+    return wrapper
+
+
+def clear_svg_cache() -> None:
+    """Clear the in-memory SVG cache."""
+    _memory_cache.clear()
@@ -0,0 +1,52 @@
+"""Helpers for writing rendered SVG charts to disk."""
+
+import gzip
+import io
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+def write_svg(svg_string: str, filename: str) -> None:
+    """Write an SVG string to a file, prefixed with the XML declaration.
+
+    The declaration and document are encoded together and written in a
+    single call rather than as two separate writes. Filenames ending in
+    ``.svgz`` are gzip-compressed.
+
+    Args:
+        svg_string: SVG content as string
+        filename: Output filename
+    """
+    if not svg_string.startswith('<?xml'):
+        svg_string = XML_DECLARATION + svg_string
+    data = svg_string.encode('utf-8')
+    if str(filename).endswith('.svgz'):
+        data = gzip.compress(data, compresslevel=6, mtime=0)
+    Path(filename).write_bytes(data)
+
+
+@contextmanager
+def open_svg(filename: str) -> Iterator[TextIO]:
+    """Open an SVG file to write a chart into as it is generated.
+
+    The file starts with the XML declaration and, like write_svg,
+    filenames ending in ``.svgz`` are gzip-compressed.
+
+    Args:
+        filename: Output filename
+
+    Yields:
+        Text stream to write the SVG markup to
+    """
+    with ExitStack() as stack:
+        raw = stack.enter_context(open(filename, 'wb'))
+        if str(filename).endswith('.svgz'):
+            raw = stack.enter_context(
+                gzip.GzipFile(filename='', mode='wb', fileobj=raw, compresslevel=6, mtime=0)
+            )
+        out = stack.enter_context(io.TextIOWrapper(raw, encoding='utf-8', newline=''))
+        out.write(XML_DECLARATION)
+        yield out
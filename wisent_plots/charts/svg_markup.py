@@ -0,0 +1,122 @@
+"""Helpers for writing SVG markup directly as strings.
+
+The output matches what xml.etree.ElementTree.tostring produces for the
+same elements, so renderers can skip building an element tree without
+changing the SVG they emit.
+"""
+
+from typing import Dict, List, Optional, TextIO
+
+
+def escape_text(text: str) -> str:
+    """Escape character data for use as element text."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def escape_attr(value: str) -> str:
+    """Escape a value for use inside a double-quoted attribute."""
+    value = escape_text(value)
+    if "\"" in value:
+        value = value.replace("\"", "&quot;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    if "\n" in value:
+        value = value.replace("\n", "&#10;")
+    if "\t" in value:
+        value = value.replace("\t", "&#09;")
+    return value
+
+
+# Hubot Sans font import and text rule used by every chart, minified. Change
+# the chart font here; the markup below is built from it
+FONT_CSS = (
+    "@import url('https://fonts.googleapis.com/css2?family=Hubot+Sans:wght@400&display=swap');"
+    "text{font-family:'Hubot Sans',sans-serif}"
+)
+
+# FONT_CSS as a <style> element
+STYLE_MARKUP = f"<style>{escape_text(FONT_CSS)}</style>"
+
+# Opening <svg> tag followed by STYLE_MARKUP. Fill in with
+# SVG_HEADER_TMPL.format(w=width, h=height)
+SVG_HEADER_TMPL = (
+    '<svg width="{w}" height="{h}" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {w} {h}">'
+    + STYLE_MARKUP.replace("{", "{{").replace("}", "}}")
+)
+
+
+def format_number(value: float) -> str:
+    """Format a coordinate with at most 2 decimals and no trailing zeros.
+
+    E.g. 12.5 -> '12.5', 3.14159 -> '3.14', 40.0 -> '40'.
+    """
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _attr_string(attrs: Dict[str, str]) -> str:
+    """Serialize attributes as ' key="value"' pairs, in order."""
+    return "".join(f' {key}="{escape_attr(value)}"' for key, value in attrs.items())
+
+
+def element(tag: str, attrs: Dict[str, str], text: Optional[str] = None) -> str:
+    """Serialize a single element with no children.
+
+    Args:
+        tag: Element tag name
+        attrs: Attribute values, in output order
+        text: Optional element text
+
+    Returns:
+        Markup such as '<rect x="1" />' or '<text x="1">label</text>'
+    """
+    attr_str = _attr_string(attrs)
+    if text:
+        return f"<{tag}{attr_str}>{escape_text(text)}</{tag}>"
+    return f"<{tag}{attr_str} />"
+
+
+def start_tag(tag: str, attrs: Dict[str, str]) -> str:
+    """Serialize the opening tag of an element that will have children."""
+    return f"<{tag}{_attr_string(attrs)}>"
+
+
+class SVGWriter:
+    """Collect SVG markup fragments and join them once at the end.
+
+    Mirrors the start/end calls of ElementTree.TreeBuilder, but appends
+    markup to a list instead of building element objects. If given a text
+    stream, fragments are written straight to it instead of being kept.
+    """
+
+    def __init__(self, out: Optional[TextIO] = None):
+        self.parts: List[str] = []
+        self._write = out.write if out is not None else self.parts.append
+
+    def element(self, tag: str, attrs: Dict[str, str], text: Optional[str] = None) -> None:
+        """Write an element with no children."""
+        self._write(element(tag, attrs, text))
+
+    def start(self, tag: str, attrs: Dict[str, str]) -> None:
+        """Open an element; close it with end()."""
+        self._write(start_tag(tag, attrs))
+
+    def end(self, tag: str) -> None:
+        """Close an element opened with start()."""
+        self._write(f"</{tag}>")
+
+    def raw(self, markup: str) -> None:
+        """Write pre-serialized markup verbatim."""
+        self._write(markup)
+
+    def getvalue(self) -> str:
+        """Return everything written so far as one string.
+
+        Empty when writing to a stream.
+        """
+        return "".join(self.parts)